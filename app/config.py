@@ -1,9 +1,15 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-load_dotenv()
+BASE_DIR = Path(__file__).resolve().parents[1]
+ENV_FILE = BASE_DIR / ".env"
+
+# deployments that inject the environment directly can skip the file lookup
+if os.getenv("SKIP_DOTENV") != "1" and ENV_FILE.exists():
+    load_dotenv(ENV_FILE, override=False)
 
 
 @dataclass(frozen=True)
@@ -24,6 +30,7 @@ class Config:
     web_host: str
     web_port: int
     web_secret_key: str
+    web_client_render: bool
     log_level: str
 
 
@@ -31,8 +38,9 @@ def _split_keywords(value: str) -> list[str]:
     return [kw.strip() for kw in value.split(",") if kw.strip()]
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    base_dir = Path(__file__).resolve().parents[1]
+    base_dir = BASE_DIR
     data_dir = Path(os.getenv("DATA_DIR", base_dir / "data"))
     data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -68,6 +76,7 @@ def load_config() -> Config:
     web_host = os.getenv("WEB_HOST", "0.0.0.0")
     web_port = int(os.getenv("WEB_PORT", "8080"))
     web_secret_key = os.getenv("WEB_SECRET_KEY", "change-me")
+    web_client_render = os.getenv("WEB_CLIENT_RENDER", "0") == "1"
 
     log_level = os.getenv("LOG_LEVEL", "INFO")
 
@@ -88,5 +97,6 @@ def load_config() -> Config:
         web_host=web_host,
         web_port=web_port,
         web_secret_key=web_secret_key,
+        web_client_render=web_client_render,
         log_level=log_level,
     )
@@ -1,23 +1,82 @@
 from __future__ import annotations
 
+import os
+import queue
 import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from .config import load_config
+from .utils import from_iso_to_local
 
 
 CONFIG = load_config()
+POOL_SIZE = 8
+SETTINGS_TTL_SECONDS = 30
+
+# idle connections are reused so the page cache and parsed schema stay warm
+_POOL: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+def _local_date(value: str | None) -> str | None:
+    # calendar day in the configured timezone, with the DST offset of that instant
+    return from_iso_to_local(value).date().isoformat() if value else None
 
 
 def get_connection() -> sqlite3.Connection:
     conn = sqlite3.connect(CONFIG.db_path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.create_function("local_date", 1, _local_date, deterministic=True)
     conn.execute("PRAGMA journal_mode=WAL;")
     conn.execute("PRAGMA foreign_keys=ON;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA cache_size=-20000;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+    conn.execute("PRAGMA busy_timeout=5000;")
     return conn
 
 
+@contextmanager
+def get_conn() -> Iterator[sqlite3.Connection]:
+    # borrow a pooled connection for several statements; the caller commits
+    try:
+        conn = _POOL.get_nowait()
+    except queue.Empty:
+        conn = get_connection()
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        try:
+            _POOL.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+def _reset_pool() -> None:
+    global _POOL
+    # connections opened before a fork (gunicorn --preload) must not be shared with the workers
+    _POOL = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+os.register_at_fork(after_in_child=_reset_pool)
+
+
+def close_all() -> None:
+    while True:
+        try:
+            conn = _POOL.get_nowait()
+        except queue.Empty:
+            return
+        conn.close()
+
+
 def init_db() -> None:
     conn = get_connection()
     cursor = conn.cursor()
@@ -49,6 +108,7 @@ def init_db() -> None:
             summary TEXT,
             tags TEXT,
             status TEXT NOT NULL DEFAULT 'new',
+            sort_score REAL GENERATED ALWAYS AS (COALESCE(relevance_score, -1)) VIRTUAL,
             UNIQUE(source, source_id)
         );
 
@@ -79,71 +139,105 @@ def init_db() -> None:
             title TEXT NOT NULL,
             created_at TEXT NOT NULL
         );
+
+        CREATE INDEX IF NOT EXISTS idx_papers_fetched ON papers(fetched_at);
+        CREATE INDEX IF NOT EXISTS idx_papers_status ON papers(status);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_due ON tasks(status, due_at);
+        CREATE INDEX IF NOT EXISTS idx_reads_read_at ON reads(read_at);
+        """
+    )
+
+    paper_columns = {row["name"] for row in conn.execute("PRAGMA table_xinfo(papers)")}
+    if "sort_score" not in paper_columns:
+        conn.execute(
+            "ALTER TABLE papers ADD COLUMN sort_score REAL GENERATED ALWAYS AS (COALESCE(relevance_score, -1)) VIRTUAL"
+        )
+    cursor.executescript(
+        """
+        DROP INDEX IF EXISTS idx_papers_status_score;
+        CREATE INDEX IF NOT EXISTS idx_papers_sort ON papers(status, sort_score DESC, published_at DESC);
         """
     )
     conn.commit()
     conn.close()
 
 
+# key -> (loaded_at, row); the ttl picks up writes made by the other process (bot vs web)
+_SETTINGS_CACHE: dict[str, tuple[float, sqlite3.Row | None]] = {}
+
+
 def get_setting(key: str, default: str | None = None) -> str | None:
-    conn = get_connection()
-    cur = conn.execute("SELECT value FROM settings WHERE key = ?", (key,))
-    row = cur.fetchone()
-    conn.close()
+    now = time.monotonic()
+    hit = _SETTINGS_CACHE.get(key)
+    if hit is None or now - hit[0] > SETTINGS_TTL_SECONDS:
+        hit = (now, fetch_one("SELECT value FROM settings WHERE key = ?", (key,)))
+        _SETTINGS_CACHE[key] = hit
+    row = hit[1]
     if row:
         return row["value"]
     return default
 
 
 def set_setting(key: str, value: str) -> None:
-    conn = get_connection()
-    conn.execute(
+    execute(
         "INSERT INTO settings(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
         (key, value),
     )
-    conn.commit()
-    conn.close()
+    _SETTINGS_CACHE.pop(key, None)
 
 
-def fetch_one(query: str, params: tuple[Any, ...] = ()) -> sqlite3.Row | None:
-    conn = get_connection()
-    cur = conn.execute(query, params)
-    row = cur.fetchone()
-    conn.close()
-    return row
+def fetch_one(query: str, params: tuple[Any, ...] = (), row_factory: Callable | None = None) -> Any:
+    with get_conn() as conn:
+        cur = conn.cursor()
+        if row_factory:
+            cur.row_factory = row_factory
+        return cur.execute(query, params).fetchone()
 
 
-def fetch_all(query: str, params: tuple[Any, ...] = ()) -> list[sqlite3.Row]:
-    conn = get_connection()
-    cur = conn.execute(query, params)
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+def fetch_all(query: str, params: tuple[Any, ...] = (), row_factory: Callable | None = None) -> list[Any]:
+    with get_conn() as conn:
+        cur = conn.cursor()
+        if row_factory:
+            cur.row_factory = row_factory
+        return cur.execute(query, params).fetchall()
 
 
 def execute(query: str, params: tuple[Any, ...] = ()) -> int:
-    conn = get_connection()
-    cur = conn.execute(query, params)
-    conn.commit()
-    row_id = cur.lastrowid
-    conn.close()
-    return row_id
+    with get_conn() as conn:
+        cur = conn.execute(query, params)
+        conn.commit()
+        return cur.lastrowid
+
+
+def execute_returning(query: str, params: tuple[Any, ...] = ()) -> list[sqlite3.Row]:
+    with get_conn() as conn:
+        rows = conn.execute(query, params).fetchall()
+        conn.commit()
+        return rows
 
 
 def execute_many(query: str, params: list[tuple[Any, ...]]) -> None:
-    conn = get_connection()
-    conn.executemany(query, params)
-    conn.commit()
-    conn.close()
+    with get_conn() as conn:
+        conn.executemany(query, params)
+        conn.commit()
+
+
+# defaults are insert-or-ignore, so once per process is enough (/start and create_app call this repeatedly)
+_DEFAULTS_DONE = False
 
 
 def ensure_defaults() -> None:
-    from .config import load_config
-
-    cfg = load_config()
-    if get_setting("thesis_topic") is None:
-        set_setting("thesis_topic", cfg.thesis_topic)
-    if get_setting("paper_keywords") is None:
-        set_setting("paper_keywords", ",".join(cfg.paper_keywords))
-    if cfg.telegram_chat_id and get_setting("telegram_chat_id") is None:
-        set_setting("telegram_chat_id", cfg.telegram_chat_id)
+    global _DEFAULTS_DONE
+    if _DEFAULTS_DONE:
+        return
+    defaults = {
+        "thesis_topic": CONFIG.thesis_topic,
+        "paper_keywords": ",".join(CONFIG.paper_keywords),
+    }
+    if CONFIG.telegram_chat_id:
+        defaults["telegram_chat_id"] = CONFIG.telegram_chat_id
+    with get_conn() as conn:
+        conn.executemany("INSERT OR IGNORE INTO settings(key, value) VALUES (?, ?)", list(defaults.items()))
+        conn.commit()
+    _SETTINGS_CACHE.clear()
+    _DEFAULTS_DONE = True
@@ -1,20 +1,43 @@
 from __future__ import annotations
 
+import re
 import urllib.parse
-from datetime import datetime
+from functools import lru_cache
 
-import feedparser
-import requests
+from lxml import etree
 
+from ._http import SESSION
 
-def _build_query(keywords: list[str]) -> str:
+
+ATOM_NS = {"a": "http://www.w3.org/2005/Atom"}
+_WS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=16)
+def _build_query(keywords: tuple[str, ...]) -> str:
     quoted = [f'"{kw}"' if " " in kw else kw for kw in keywords]
     query = " OR ".join([f"all:{kw}" for kw in quoted])
     return query
 
 
+def _norm(value: str | None) -> str:
+    return _WS.sub(" ", value).strip() if value else ""
+
+
+def _text(entry: etree._Element, path: str) -> str:
+    return _norm(entry.findtext(path, namespaces=ATOM_NS))
+
+
+def _link(entry: etree._Element) -> str | None:
+    links = entry.findall("a:link", ATOM_NS)
+    for link in links:
+        if link.get("rel", "alternate") == "alternate":
+            return link.get("href")
+    return links[0].get("href") if links else None
+
+
 def fetch_arxiv(keywords: list[str], max_results: int = 50) -> list[dict]:
-    query = _build_query(keywords)
+    query = _build_query(tuple(keywords))
     params = {
         "search_query": query,
         "start": 0,
@@ -23,27 +46,22 @@ def fetch_arxiv(keywords: list[str], max_results: int = 50) -> list[dict]:
         "sortOrder": "descending",
     }
     url = "http://export.arxiv.org/api/query?" + urllib.parse.urlencode(params)
-    headers = {"User-Agent": "PersonalResearchAssistant/1.0"}
-    response = requests.get(url, headers=headers, timeout=30)
+    response = SESSION.get(url, timeout=30)
     response.raise_for_status()
 
-    feed = feedparser.parse(response.text)
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    root = etree.fromstring(response.content, parser=parser)
     papers = []
-    for entry in feed.entries:
-        paper_id = entry.get("id")
-        title = " ".join(entry.get("title", "").split())
-        summary = " ".join(entry.get("summary", "").split())
-        authors = ", ".join([author.name for author in entry.get("authors", [])])
-        published = entry.get("published")
-        link = entry.get("link")
+    for entry in root.iterfind("a:entry", ATOM_NS):
+        authors = ", ".join(_text(author, "a:name") for author in entry.iterfind("a:author", ATOM_NS))
         papers.append(
             {
-                "source_id": paper_id,
-                "title": title,
-                "abstract": summary,
+                "source_id": entry.findtext("a:id", namespaces=ATOM_NS),
+                "title": _text(entry, "a:title"),
+                "abstract": _text(entry, "a:summary"),
                 "authors": authors,
-                "published_at": published,
-                "url": link,
+                "published_at": entry.findtext("a:published", namespaces=ATOM_NS),
+                "url": _link(entry),
             }
         )
     return papers
@@ -1,8 +1,36 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 
 import google.generativeai as genai
+import orjson
+
+
+@lru_cache(maxsize=1)
+def _get_model(api_key: str) -> genai.GenerativeModel:
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(
+        "gemini-1.5-flash",
+        generation_config={"response_mime_type": "application/json"},
+    )
+
+
+def _parse_analysis(data: object) -> tuple[float | None, str | None, str | None]:
+    if not isinstance(data, dict):
+        return None, None, None
+
+    score = data.get("score")
+    summary = data.get("summary")
+    tags = data.get("tags")
+    if isinstance(tags, list):
+        tags = ", ".join(tags)
+
+    try:
+        score_value = float(score) if score is not None else None
+    except (ValueError, TypeError):
+        score_value = None
+
+    return score_value, summary, tags if isinstance(tags, str) else None
 
 
 def analyze_paper(
@@ -11,9 +39,6 @@ def analyze_paper(
     title: str,
     abstract: str,
 ) -> tuple[float | None, str | None, str | None]:
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel("gemini-1.5-flash")
-
     prompt = (
         "Aşağıdaki makaleyi tez konusuna göre değerlendir.\n"
         f"Tez konusu: {thesis_topic}\n\n"
@@ -22,31 +47,43 @@ def analyze_paper(
         "Yanıtı sadece JSON olarak ver. Anahtarlar: score (0-100 sayı), summary (1-2 cümle Türkçe), tags (3 kısa etiket)."
     )
 
-    response = model.generate_content(prompt)
+    response = _get_model(api_key).generate_content(prompt)
     text = response.text or ""
 
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        # try to extract JSON from text
-        start = text.find("{")
-        end = text.rfind("}")
-        if start == -1 or end == -1:
-            return None, None, None
-        try:
-            data = json.loads(text[start : end + 1])
-        except json.JSONDecodeError:
-            return None, None, None
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return None, None, None
+    return _parse_analysis(data)
 
-    score = data.get("score")
-    summary = data.get("summary")
-    tags = data.get("tags")
-    if isinstance(tags, list):
-        tags = ", ".join(tags)
+
+def analyze_papers(
+    api_key: str,
+    thesis_topic: str,
+    items: list[dict],
+) -> list[tuple[float | None, str | None, str | None]]:
+    papers_text = "\n\n".join(
+        f"[{index}] Başlık: {item['title']}\nÖzet: {item.get('abstract') or 'Özet yok.'}"
+        for index, item in enumerate(items, start=1)
+    )
+    prompt = (
+        "Aşağıdaki makaleleri tez konusuna göre değerlendir.\n"
+        f"Tez konusu: {thesis_topic}\n\n"
+        f"{papers_text}\n\n"
+        "Yanıtı sadece JSON dizisi olarak ver; girdi sırasıyla her makale için bir nesne. "
+        "Anahtarlar: score (0-100 sayı), summary (1-2 cümle Türkçe), tags (3 kısa etiket)."
+    )
+
+    response = _get_model(api_key).generate_content(prompt)
+    text = response.text or ""
 
     try:
-        score_value = float(score) if score is not None else None
-    except (ValueError, TypeError):
-        score_value = None
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        data = []
+    if not isinstance(data, list):
+        data = []
 
-    return score_value, summary, tags if isinstance(tags, str) else None
+    results = [_parse_analysis(entry) for entry in data[: len(items)]]
+    results.extend([(None, None, None)] * (len(items) - len(results)))
+    return results
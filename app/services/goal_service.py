@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime
 
 from ..db import execute, fetch_all
@@ -14,12 +15,12 @@ def create_goal(title: str, year: int) -> int:
     )
 
 
-def list_goals(status: str = "active") -> list[dict]:
+def list_goals(status: str = "active") -> list[sqlite3.Row]:
     rows = fetch_all(
         "SELECT * FROM goals WHERE status = ? ORDER BY year DESC, created_at DESC",
         (status,),
     )
-    return [dict(row) for row in rows]
+    return rows
 
 
 def update_progress(goal_id: int, progress: int) -> None:
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from ..config import load_config
 from ..db import get_setting, set_setting
 from ..utils import now_local, to_utc_iso
 from .arxiv_client import fetch_arxiv
-from .gemini_client import analyze_paper
-from .paper_service import store_paper, update_analysis
+from .gemini_client import analyze_papers
+from .paper_service import store_papers_bulk, update_analyses_bulk
 from .semantic_client import fetch_semantic_scholar
 
 
 CONFIG = load_config()
+ANALYSIS_WORKERS = 8
+ANALYSIS_BATCH_SIZE = 8
 
 
 def _load_keywords() -> list[str]:
@@ -29,77 +33,77 @@ def scan_papers() -> dict:
 
     max_results = CONFIG.max_papers_per_day if CONFIG.max_papers_per_day > 0 else 200
 
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        arxiv_future = pool.submit(fetch_arxiv, keywords, max_results=max_results)
+        semantic_future = pool.submit(
+            fetch_semantic_scholar,
+            keywords,
+            max_results=max_results,
+            api_key=CONFIG.semantic_scholar_api_key,
+        )
+
     try:
-        arxiv_papers = fetch_arxiv(keywords, max_results=max_results)
+        arxiv_papers = arxiv_future.result()
     except Exception:
         arxiv_papers = []
 
     try:
-        semantic_papers = fetch_semantic_scholar(
-            keywords,
-            max_results=max_results,
-            api_key=CONFIG.semantic_scholar_api_key,
-        )
+        semantic_papers = semantic_future.result()
     except Exception:
         semantic_papers = []
 
-    new_papers = 0
-    analyzed = 0
-    analysis_budget = CONFIG.max_papers_per_day
-
-    for paper in arxiv_papers:
-        paper_id = store_paper(
-            "arxiv",
-            paper["source_id"],
-            paper["title"],
-            paper.get("abstract"),
-            paper.get("url"),
-            paper.get("authors"),
-            paper.get("published_at"),
-            fetched_at,
-        )
-        if paper_id:
-            new_papers += 1
-            if analysis_budget > 0:
-                try:
-                    score, summary, tags = analyze_paper(
-                        CONFIG.gemini_api_key,
-                        _load_thesis_topic(),
-                        paper["title"],
-                        paper.get("abstract") or "",
-                    )
-                    update_analysis(paper_id, score, summary, tags)
-                    analyzed += 1
-                    analysis_budget -= 1
-                except Exception:
-                    pass
-
-    for paper in semantic_papers:
-        paper_id = store_paper(
-            "semantic_scholar",
-            paper["source_id"],
-            paper["title"],
-            paper.get("abstract"),
-            paper.get("url"),
-            paper.get("authors"),
-            paper.get("published_at"),
-            fetched_at,
-        )
+    candidates = [("arxiv", paper) for paper in arxiv_papers]
+    candidates.extend(("semantic_scholar", paper) for paper in semantic_papers)
+    inserted = store_papers_bulk(
+        [
+            (
+                source,
+                paper["source_id"],
+                paper["title"],
+                paper.get("abstract"),
+                paper.get("url"),
+                paper.get("authors"),
+                paper.get("published_at"),
+                fetched_at,
+            )
+            for source, paper in candidates
+        ]
+    )
+
+    new_papers = len(inserted)
+    to_analyze = []
+    for source, paper in candidates:
+        paper_id = inserted.pop((source, paper["source_id"]), None)
         if paper_id:
-            new_papers += 1
-            if analysis_budget > 0:
+            to_analyze.append((paper_id, paper))
+    to_analyze = to_analyze[: max(CONFIG.max_papers_per_day, 0)]
+
+    batches = [
+        to_analyze[start : start + ANALYSIS_BATCH_SIZE]
+        for start in range(0, len(to_analyze), ANALYSIS_BATCH_SIZE)
+    ]
+    analyses = []
+    if batches:
+        thesis_topic = _load_thesis_topic()
+        with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as pool:
+            futures = {
+                pool.submit(
+                    analyze_papers,
+                    CONFIG.gemini_api_key,
+                    thesis_topic,
+                    [{"title": paper["title"], "abstract": paper.get("abstract")} for _, paper in batch],
+                ): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
                 try:
-                    score, summary, tags = analyze_paper(
-                        CONFIG.gemini_api_key,
-                        _load_thesis_topic(),
-                        paper["title"],
-                        paper.get("abstract") or "",
-                    )
-                    update_analysis(paper_id, score, summary, tags)
-                    analyzed += 1
-                    analysis_budget -= 1
+                    results = future.result()
                 except Exception:
-                    pass
+                    continue
+                for (paper_id, _), (score, summary, tags) in zip(futures[future], results):
+                    if score is not None or summary:
+                        analyses.append((score, summary, tags, paper_id))
+    update_analyses_bulk(analyses)
 
     set_setting("last_scan", fetched_at)
-    return {"new_papers": new_papers, "analyzed": analyzed}
+    return {"new_papers": new_papers, "analyzed": len(analyses)}
@@ -1,56 +1,114 @@
 from __future__ import annotations
 
-from ..db import execute, fetch_all, fetch_one
-
-
-def store_paper(
-    source: str,
-    source_id: str,
-    title: str,
-    abstract: str | None,
-    url: str | None,
-    authors: str | None,
-    published_at: str | None,
-    fetched_at: str,
-) -> int | None:
-    try:
-        paper_id = execute(
-            """
-            INSERT INTO papers(source, source_id, title, abstract, url, authors, published_at, fetched_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (source, source_id, title, abstract, url, authors, published_at, fetched_at),
-        )
-        return paper_id
-    except Exception:
-        return None
+import logging
+import sqlite3
+import time
+from collections.abc import Iterator
+
+from ..db import execute_many, fetch_all, fetch_one, get_conn
+
+
+COUNT_TTL_SECONDS = 60
+PAPER_FETCH_BATCH = 20
+
+# list views never show the abstract, which is by far the largest column; get_paper still returns it
+_LIST_COLUMNS = "id, source, source_id, title, url, authors, published_at, fetched_at, relevance_score, summary, tags, status"
+
+# totals only move on scans and reads, so a short TTL spares a COUNT(*) per summary/dashboard
+_count_cache: dict[str | None, tuple[float, int]] = {}
+_version = 0
+
 
+def _changed(counts: bool = True) -> None:
+    global _version
+    _version += 1
+    if counts:
+        _count_cache.clear()
 
-def list_papers(status: str | None = None, limit: int = 50) -> list[dict]:
+
+def papers_version() -> int:
+    return _version
+
+
+def store_papers_bulk(rows: list[tuple]) -> dict[tuple[str, str], int]:
+    # rows are (source, source_id, title, abstract, url, authors, published_at, fetched_at);
+    # returns ids of newly inserted rows only
+    missing = [row for row in rows if not row[1]]
+    if missing:
+        # source_id is NOT NULL; OR IGNORE would drop these without a trace
+        logging.getLogger(__name__).warning(
+            "Skipping %d paper(s) without a source id: %s", len(missing), [row[2] for row in missing]
+        )
+    inserted: dict[tuple[str, str], int] = {}
+    with get_conn() as conn:
+        # one transaction; RETURNING reports exactly the rows this call added (ignored duplicates return nothing)
+        for row in rows:
+            if not row[1] or (row[0], row[1]) in inserted:
+                continue
+            for new in conn.execute(
+                """
+                INSERT OR IGNORE INTO papers(source, source_id, title, abstract, url, authors, published_at, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING id
+                """,
+                row,
+            ):
+                inserted[(row[0], row[1])] = new["id"]
+        conn.commit()
+    if inserted:
+        _changed()
+    return inserted
+
+
+def _list_papers_query(status: str | None, limit: int) -> tuple[str, tuple]:
     if status:
-        rows = fetch_all(
-            "SELECT * FROM papers WHERE status = ? ORDER BY relevance_score IS NULL, relevance_score DESC, published_at DESC LIMIT ?",
+        return (
+            f"SELECT {_LIST_COLUMNS} FROM papers WHERE status = ? ORDER BY sort_score DESC, published_at DESC LIMIT ?",
             (status, limit),
         )
-    else:
-        rows = fetch_all(
-            "SELECT * FROM papers ORDER BY published_at DESC LIMIT ?",
-            (limit,),
-        )
-    return [dict(row) for row in rows]
+    return f"SELECT {_LIST_COLUMNS} FROM papers ORDER BY published_at DESC LIMIT ?", (limit,)
+
 
+def list_papers(status: str | None = None, limit: int = 50) -> list[sqlite3.Row]:
+    return fetch_all(*_list_papers_query(status, limit))
 
-def list_papers_since(since_iso: str, limit: int = 20) -> list[dict]:
+
+def iter_papers(status: str | None = None, limit: int = 50) -> Iterator[sqlite3.Row]:
+    # rows are handed out as sqlite produces them; the connection returns to the pool once exhausted
+    with get_conn() as conn:
+        cursor = conn.execute(*_list_papers_query(status, limit))
+        while rows := cursor.fetchmany(PAPER_FETCH_BATCH):
+            yield from rows
+
+
+def list_papers_since(since_iso: str, limit: int = 20) -> list[sqlite3.Row]:
+    rows = fetch_all(
+        f"""
+        SELECT {_LIST_COLUMNS} FROM papers
+        WHERE fetched_at >= ?
+        ORDER BY sort_score DESC, published_at DESC
+        LIMIT ?
+        """,
+        (since_iso, limit),
+    )
+    return rows
+
+
+def summary_bundle(since_iso: str, limit: int = 20) -> tuple[list[sqlite3.Row], int]:
     rows = fetch_all(
-        """
-        SELECT * FROM papers
+        f"""
+        SELECT {_LIST_COLUMNS}, (SELECT COUNT(*) FROM papers) AS total FROM papers
         WHERE fetched_at >= ?
-        ORDER BY relevance_score IS NULL, relevance_score DESC, published_at DESC
+        ORDER BY sort_score DESC, published_at DESC
         LIMIT ?
         """,
         (since_iso, limit),
     )
-    return [dict(row) for row in rows]
+    if not rows:
+        return rows, count_papers()
+    total = int(rows[0]["total"])
+    _count_cache[None] = (time.monotonic(), total)
+    return rows, total
 
 
 def get_paper(paper_id: int) -> dict | None:
@@ -58,24 +116,44 @@ def get_paper(paper_id: int) -> dict | None:
     return dict(row) if row else None
 
 
-def update_analysis(paper_id: int, score: float | None, summary: str | None, tags: str | None) -> None:
-    execute(
+def update_analyses_bulk(rows: list[tuple[float | None, str | None, str | None, int]]) -> None:
+    execute_many(
         "UPDATE papers SET relevance_score = ?, summary = ?, tags = ? WHERE id = ?",
-        (score, summary, tags, paper_id),
+        rows,
     )
+    _changed(counts=False)
 
 
 def mark_read(paper_id: int, read_at_iso: str) -> None:
-    execute("UPDATE papers SET status = 'read' WHERE id = ?", (paper_id,))
-    execute("INSERT INTO reads(paper_id, read_at) VALUES (?, ?)", (paper_id, read_at_iso))
+    mark_read_many([paper_id], read_at_iso)
+
+
+def mark_read_many(paper_ids: list[int], read_at_iso: str) -> list[int]:
+    if not paper_ids:
+        return []
+    placeholders = ", ".join("?" for _ in paper_ids)
+    with get_conn() as conn:
+        rows = conn.execute(
+            f"UPDATE papers SET status = 'read' WHERE id IN ({placeholders}) RETURNING id", tuple(paper_ids)
+        ).fetchall()
+        ids = [row["id"] for row in rows]
+        conn.executemany("INSERT INTO reads(paper_id, read_at) VALUES (?, ?)", [(paper_id, read_at_iso) for paper_id in ids])
+        conn.commit()
+    _changed()
+    return ids
 
 
 def count_papers(status: str | None = None) -> int:
+    cached = _count_cache.get(status)
+    if cached and time.monotonic() - cached[0] < COUNT_TTL_SECONDS:
+        return cached[1]
     if status:
         row = fetch_one("SELECT COUNT(*) as total FROM papers WHERE status = ?", (status,))
     else:
         row = fetch_one("SELECT COUNT(*) as total FROM papers", ())
-    return int(row["total"]) if row else 0
+    total = int(row["total"]) if row else 0
+    _count_cache[status] = (time.monotonic(), total)
+    return total
 
 
 def count_tasks(status: str) -> int:
@@ -83,9 +161,9 @@ def count_tasks(status: str) -> int:
     return int(row["total"]) if row else 0
 
 
-def latest_papers(limit: int = 5) -> list[dict]:
+def latest_papers(limit: int = 5) -> list[sqlite3.Row]:
     rows = fetch_all(
-        "SELECT * FROM papers ORDER BY published_at IS NULL, published_at DESC, fetched_at DESC LIMIT ?",
+        f"SELECT {_LIST_COLUMNS} FROM papers ORDER BY published_at IS NULL, published_at DESC, fetched_at DESC LIMIT ?",
         (limit,),
     )
-    return [dict(row) for row in rows]
+    return rows
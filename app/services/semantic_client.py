@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import requests
+from ._http import SESSION
 
 
 def fetch_semantic_scholar(
@@ -16,11 +16,9 @@ def fetch_semantic_scholar(
         "limit": max_results,
         "fields": "title,abstract,url,authors,venue,year,publicationDate",
     }
-    headers = {"User-Agent": "PersonalResearchAssistant/1.0"}
-    if api_key:
-        headers["x-api-key"] = api_key
+    headers = {"x-api-key": api_key} if api_key else None
 
-    response = requests.get(url, params=params, headers=headers, timeout=30)
+    response = SESSION.get(url, params=params, headers=headers, timeout=30)
     response.raise_for_status()
 
     data = response.json()
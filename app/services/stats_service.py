@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from ..db import fetch_all
-from ..utils import from_iso_to_local, get_tz
+from ..db import fetch_all, fetch_one
+from ..utils import get_tz, to_utc_iso
 
 
-def get_read_streak() -> int:
-    rows = fetch_all("SELECT read_at FROM reads ORDER BY read_at DESC")
-    if not rows:
-        return 0
+STREAK_MAX_DAYS = 400
 
-    dates = sorted({from_iso_to_local(row["read_at"]).date() for row in rows}, reverse=True)
-    if not dates:
-        return 0
 
-    streak = 0
-    today = datetime.now(tz=get_tz()).date()
-    expected = today
+def get_read_streak() -> int:
+    now = datetime.now(tz=get_tz())
+    # local_date converts each row with its own offset, so reads near midnight stay on the right day across DST
+    rows = fetch_all(
+        """
+        SELECT DISTINCT local_date(read_at) AS day FROM reads
+        WHERE read_at >= ?
+        ORDER BY day DESC
+        LIMIT ?
+        """,
+        (to_utc_iso(now - timedelta(days=STREAK_MAX_DAYS + 1)), STREAK_MAX_DAYS),
+    )
 
-    for day in dates:
+    streak = 0
+    expected = now.date()
+    for row in rows:
+        day = date.fromisoformat(row["day"])
         if day == expected:
             streak += 1
             expected = expected - timedelta(days=1)
@@ -27,3 +33,17 @@ def get_read_streak() -> int:
             # gap
             break
     return streak
+
+
+def get_dashboard_counts() -> dict[str, int]:
+    # one round-trip; each subquery is answered from the status indexes
+    row = fetch_one(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM tasks WHERE status = 'pending') AS pending_tasks,
+            (SELECT COUNT(*) FROM tasks WHERE status = 'done') AS done_tasks,
+            (SELECT COUNT(*) FROM papers WHERE status = 'new') AS new_papers,
+            (SELECT COUNT(*) FROM papers WHERE status = 'read') AS read_papers
+        """
+    )
+    return {key: int(row[key]) for key in row.keys()}
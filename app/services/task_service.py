@@ -1,26 +1,63 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 
-from ..db import execute, fetch_all, fetch_one
+from ..db import execute, execute_returning, fetch_all, fetch_one
 from ..utils import now_local, to_utc_iso
 
 
+@dataclass(slots=True)
+class TaskRow:
+    id: int
+    title: str
+    due_at: str | None
+    created_at: str
+    status: str
+    source: str | None
+    reminded_at: str | None
+    notes: str | None
+
+
+_TASK_COLUMNS = "id, title, due_at, created_at, status, source, reminded_at, notes"
+
+
+def _task_row(cursor, row: tuple) -> TaskRow:
+    return TaskRow(*row)
+
+
+_version = 0
+
+
+def _bump_version() -> None:
+    global _version
+    _version += 1
+
+
+def tasks_version() -> tuple[int, int, int]:
+    # local mutations (incl. snoozes) plus a pending-set fingerprint that also catches other processes
+    row = fetch_one("SELECT COUNT(*) AS total, MAX(id) AS max_id FROM tasks WHERE status = 'pending'")
+    return _version, row["total"], row["max_id"] or 0
+
+
 def create_task(title: str, due_at: datetime | None, source: str, notes: str | None = None) -> int:
     due_value = to_utc_iso(due_at) if due_at else None
     created_at = to_utc_iso(now_local())
-    return execute(
+    task_id = execute(
         "INSERT INTO tasks(title, due_at, created_at, source, notes) VALUES (?, ?, ?, ?, ?)",
         (title, due_value, created_at, source, notes),
     )
+    _bump_version()
+    return task_id
 
 
-def list_tasks(status: str = "pending", limit: int = 20) -> list[dict]:
+def list_tasks(status: str = "pending", limit: int = 20) -> list[TaskRow]:
     rows = fetch_all(
-        "SELECT * FROM tasks WHERE status = ? ORDER BY due_at IS NULL, due_at ASC, created_at DESC LIMIT ?",
+        f"SELECT {_TASK_COLUMNS} FROM tasks WHERE status = ? ORDER BY due_at IS NULL, due_at ASC, created_at DESC LIMIT ?",
         (status, limit),
+        row_factory=_task_row,
     )
-    return [dict(row) for row in rows]
+    return rows
 
 
 def count_tasks(status: str = "pending") -> int:
@@ -28,34 +65,82 @@ def count_tasks(status: str = "pending") -> int:
     return int(row["total"]) if row else 0
 
 
-def list_tasks_between(start_iso: str, end_iso: str) -> list[dict]:
+def summary_counts() -> dict[str, int]:
+    counts = {"pending": 0, "done": 0}
+    for row in fetch_all("SELECT status, COUNT(*) AS total FROM tasks GROUP BY status"):
+        counts[row["status"]] = int(row["total"])
+    return counts
+
+
+def list_tasks_between(start_iso: str, end_iso: str) -> list[TaskRow]:
     rows = fetch_all(
-        """
-        SELECT * FROM tasks
+        f"""
+        SELECT {_TASK_COLUMNS} FROM tasks
         WHERE status = 'pending'
           AND due_at IS NOT NULL
           AND due_at BETWEEN ? AND ?
         ORDER BY due_at ASC
         """,
         (start_iso, end_iso),
+        row_factory=_task_row,
+    )
+    return rows
+
+
+def list_tasks_for_dashboard(start_iso: str, end_iso: str, pending_limit: int = 8) -> tuple[list[TaskRow], list[TaskRow]]:
+    # today's tasks and the upcoming list in one statement; rows are tagged with the list they belong to
+    rows = fetch_all(
+        f"""
+        SELECT * FROM (
+            SELECT 1 AS today, {_TASK_COLUMNS} FROM tasks
+            WHERE status = 'pending'
+              AND due_at IS NOT NULL
+              AND due_at BETWEEN ? AND ?
+            ORDER BY due_at ASC
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 0 AS today, {_TASK_COLUMNS} FROM tasks
+            WHERE status = 'pending'
+            ORDER BY due_at IS NULL, due_at ASC, created_at DESC
+            LIMIT ?
+        )
+        """,
+        (start_iso, end_iso, pending_limit),
+        row_factory=lambda cursor, row: (row[0], TaskRow(*row[1:])),
     )
-    return [dict(row) for row in rows]
+    today = [task for is_today, task in rows if is_today]
+    pending = [task for is_today, task in rows if not is_today]
+    return today, pending
 
 
 def mark_done(task_id: int) -> bool:
-    row = fetch_one("SELECT id FROM tasks WHERE id = ?", (task_id,))
-    if not row:
-        return False
-    execute("UPDATE tasks SET status = 'done' WHERE id = ?", (task_id,))
-    return True
+    return bool(mark_done_many([task_id]))
+
+
+def mark_done_many(task_ids: list[int]) -> list[int]:
+    # one statement for the whole selection; RETURNING reports which ids existed
+    if not task_ids:
+        return []
+    placeholders = ", ".join("?" for _ in task_ids)
+    rows = execute_returning(f"UPDATE tasks SET status = 'done' WHERE id IN ({placeholders}) RETURNING id", tuple(task_ids))
+    if rows:
+        _bump_version()
+    return [row["id"] for row in rows]
 
 
 def delete_task(task_id: int) -> bool:
-    row = fetch_one("SELECT id FROM tasks WHERE id = ?", (task_id,))
-    if not row:
-        return False
-    execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-    return True
+    return bool(delete_task_many([task_id]))
+
+
+def delete_task_many(task_ids: list[int]) -> list[int]:
+    if not task_ids:
+        return []
+    placeholders = ", ".join("?" for _ in task_ids)
+    rows = execute_returning(f"DELETE FROM tasks WHERE id IN ({placeholders}) RETURNING id", tuple(task_ids))
+    if rows:
+        _bump_version()
+    return [row["id"] for row in rows]
 
 
 def snooze_task(task_id: int, new_due_at: datetime) -> bool:
@@ -63,6 +148,7 @@ def snooze_task(task_id: int, new_due_at: datetime) -> bool:
     if not row:
         return False
     execute("UPDATE tasks SET due_at = ?, reminded_at = NULL WHERE id = ?", (to_utc_iso(new_due_at), task_id))
+    _bump_version()
     return True
 
 
@@ -85,10 +171,10 @@ def clear_pending_task(pending_id: int) -> None:
     execute("DELETE FROM pending_tasks WHERE id = ?", (pending_id,))
 
 
-def due_tasks_for_reminder(now_iso: str) -> list[dict]:
+def due_tasks_for_reminder(now_iso: str) -> list[TaskRow]:
     rows = fetch_all(
-        """
-        SELECT * FROM tasks
+        f"""
+        SELECT {_TASK_COLUMNS} FROM tasks
         WHERE status = 'pending'
           AND due_at IS NOT NULL
           AND reminded_at IS NULL
@@ -96,14 +182,20 @@ def due_tasks_for_reminder(now_iso: str) -> list[dict]:
         ORDER BY due_at ASC
         """,
         (now_iso,),
+        row_factory=_task_row,
     )
-    return [dict(row) for row in rows]
+    return rows
 
 
-def set_reminded(task_id: int, reminded_at_iso: str) -> None:
-    execute("UPDATE tasks SET reminded_at = ? WHERE id = ?", (reminded_at_iso, task_id))
+def bulk_set_reminded(task_ids: list[int], reminded_at_iso: str) -> None:
+    if not task_ids:
+        return
+    placeholders = ", ".join("?" for _ in task_ids)
+    execute(
+        f"UPDATE tasks SET reminded_at = ? WHERE id IN ({placeholders})",
+        (reminded_at_iso, *task_ids),
+    )
 
 
-def get_task(task_id: int) -> dict | None:
-    row = fetch_one("SELECT * FROM tasks WHERE id = ?", (task_id,))
-    return dict(row) if row else None
+def get_task(task_id: int) -> TaskRow | None:
+    return fetch_one(f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,), row_factory=_task_row)
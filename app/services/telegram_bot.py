@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import sqlite3
 from datetime import timedelta
+from functools import lru_cache
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ApplicationBuilder, CallbackQueryHandler, CommandHandler, ContextTypes, MessageHandler, filters
@@ -10,14 +13,14 @@ from telegram.ext import ApplicationBuilder, CallbackQueryHandler, CommandHandle
 from ..config import load_config
 from ..db import ensure_defaults, get_setting, set_setting
 from ..task_parser import looks_like_task, parse_duration, parse_task_text
-from ..utils import format_dt_local, from_iso_to_local, now_local, parse_time_str, to_utc_iso
+from ..utils import format_dt_local, format_iso_local, from_iso_to_local, now_local, parse_time_str, to_utc_iso
 from .goal_service import create_goal, list_goals
 from .paper_scanner import scan_papers
-from .paper_service import count_papers, list_papers_since, mark_read
+from .paper_service import list_papers_since, mark_read, papers_version, summary_bundle
 from .task_service import (
     add_pending_task,
+    bulk_set_reminded,
     clear_pending_task,
-    count_tasks,
     create_task,
     delete_task,
     due_tasks_for_reminder,
@@ -27,7 +30,9 @@ from .task_service import (
     list_tasks_between,
     mark_done,
     snooze_task,
-    set_reminded,
+    summary_counts,
+    tasks_version,
+    TaskRow,
 )
 
 
@@ -37,6 +42,70 @@ BOT_ROLE = "Kişisel araştırma asistanın."
 
 SUMMARY_TASK_LIMIT = 6
 SUMMARY_PAPER_LIMIT = 6
+TASK_INDEX_LIMIT = 50
+SUMMARY_CACHE_MINUTES = 5
+DIGEST_PAGE_LIMIT = 3800
+DIGEST_TITLE_LIMIT = 300
+DIGEST_HEADER = "📌 Günlük makale özeti:"
+
+# the scheduled scan and /scan run in worker threads; one at a time so they never process the same batch twice
+_SCAN_LOCK = asyncio.Lock()
+
+_TITLE_FILLER_RE = re.compile(
+    r"\b(bana|beni|bize|bizim|lütfen|lutfen|hatırlatma|hatirlatma|hatırlat|hatirlat|şunu|şu|bunu|görevi|görev)\b"
+)
+_TITLE_VERB_MAP = {
+    "yapacağımı": "yapılacak",
+    "yapacağım": "yapılacak",
+    "gideceğimi": "gidilecek",
+    "gideceğim": "gidilecek",
+    "tamamlayacağımı": "tamamlanacak",
+    "tamamlayacağım": "tamamlanacak",
+    "hazırlayacağımı": "hazırlanacak",
+    "hazırlayacağım": "hazırlanacak",
+    "göndereceğimi": "gönderilecek",
+    "göndereceğim": "gönderilecek",
+}
+_TITLE_VERB_RE = re.compile("|".join(re.escape(word) for word in sorted(_TITLE_VERB_MAP, key=len, reverse=True)))
+_TITLE_SUFFIX_MAP = {"yapmak": "yapılacak", "gitmek": "gidilecek"}
+_TITLE_SUFFIX_RE = re.compile(r"(yapmak|gitmek)$")
+_ACTION_STOPWORDS = r"\b(?:şu|bunu|şunu|bu|o|hatırlatma|hatirlatma|görev|görevi|hatırlatmayı|hatirlatmayi)\b"
+_SPACE_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w{3,}")
+_ID_RE = re.compile(r"#?(\d+)")
+_YEAR_RE = re.compile(r"(20\d{2})")
+
+
+def _keyword_re(words: tuple[str, ...]) -> re.Pattern[str]:
+    # one alternation scan instead of a python-level `in` test per keyword
+    return re.compile("|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
+
+
+SUMMARY_WORDS = ("özet", "ozet", "summary", "rapor", "durum")
+TEMPLATE_WORDS = ("şablon", "template", "örnek")
+DELETE_WORDS = ("sil", "kaldır", "iptal et", "silmek")
+COMPLETE_WORDS = ("tamamlandı", "tamamladım", "tamamla", "bitirdim", "bitti")
+LIST_WORDS = ("listele", "görev", "liste")
+GOAL_WORDS = ("hedef",)
+GREETING_WORDS = ("merhaba", "selam", "naber", "nasılsın", "nasilsin")
+THANKS_WORDS = ("teşekkür", "tesekkur", "sağ ol", "sag ol")
+IDENTITY_WORDS = ("kimsin", "nesin", "ne yaparsın")
+
+_INTENT_WORDS = {
+    "summary": SUMMARY_WORDS,
+    "template": TEMPLATE_WORDS,
+    "delete": DELETE_WORDS,
+    "done": COMPLETE_WORDS,
+    "list": LIST_WORDS,
+    "goal": GOAL_WORDS,
+    "greet": GREETING_WORDS,
+    "thanks": THANKS_WORDS,
+    "whoami": IDENTITY_WORDS,
+}
+_ID_ONLY_RE = re.compile(rf"^\s*/?#?(\d+)\s*({_keyword_re(DELETE_WORDS + COMPLETE_WORDS).pattern})\s*$")
+_INTENT_RE = re.compile(
+    "|".join(f"(?P<{intent}>{_keyword_re(words).pattern})" for intent, words in _INTENT_WORDS.items())
+)
 
 TEMPLATE_EXAMPLES = [
     "Bana yarın 15:00 danışman toplantısını hatırlat",
@@ -45,18 +114,40 @@ TEMPLATE_EXAMPLES = [
     "Şu hatırlatmayı sil: danışman toplantısı",
     "Özet",
 ]
+TEMPLATES_TEXT = "\n".join(["Örnek kalıplar:", *(f"• {example}" for example in TEMPLATE_EXAMPLES)])
+START_TEXT = (
+    f"Merhaba! Ben {BOT_NAME}. {BOT_ROLE}\n"
+    "Örnek: 'yarın saat 3'te danışman toplantısı var hatırlat' ya da 'bu hafta thesis proposal bitir'.\n"
+    "Komutlar: /tasks, /today, /week, /done <id>, /delete <id>, /snooze <id> 2 saat, /summary, /papers, /goals, /goal"
+)
+HELP_TEXT = (
+    "Komutlar:\n"
+    "/tasks - tüm açık görevler\n"
+    "/today - bugünkü görevler\n"
+    "/week - bu haftaki görevler\n"
+    "/done <id> - görevi tamamla\n"
+    "/delete <id> - görevi sil\n"
+    "/snooze <id> 2 saat - ertele\n"
+    "/summary - görev ve makale özeti\n"
+    "/templates - örnek cümleler\n"
+    "/papers - yeni makaleler\n"
+    "/goals - yıllık hedefler\n"
+    "/goal <yıl> <hedef> - yeni hedef ekle\n"
+    "/scan - makale taramasını şimdi başlat\n"
+    "/read <id> - makale okundu olarak işaretle\n"
+)
 
 
-def _format_task_line(task: dict) -> str:
+def _format_task_line(task: TaskRow) -> str:
     due = None
-    if task.get("due_at"):
-        due = format_dt_local(from_iso_to_local(task["due_at"]))
+    if task.due_at:
+        due = format_iso_local(task.due_at)
     else:
         due = "(tarih yok)"
-    return f"#{task['id']} • {task['title']} — {due}"
+    return f"#{task.id} • {task.title} — {due}"
 
 
-def _format_tasks(tasks: list[dict]) -> str:
+def _format_tasks(tasks: list[TaskRow]) -> str:
     if not tasks:
         return "Görev bulunamadı."
     lines = ["Görevler:"]
@@ -84,29 +175,13 @@ def _normalize_task_title(title: str) -> str:
         return "Görev."
 
     lowered = text.lower()
-    lowered = re.sub(r"\b(bana|beni|bize|bizim|lütfen|lutfen|hatırlat|hatirlat)\b", " ", lowered)
-    lowered = re.sub(r"\b(şunu|şu|bunu|bana|beni|hatırlatma|hatirlatma|görev|görevi)\b", " ", lowered)
-    lowered = re.sub(r"\s+", " ", lowered).strip()
-
-    replacements = {
-        "yapacağımı": "yapılacak",
-        "yapacağım": "yapılacak",
-        "gideceğimi": "gidilecek",
-        "gideceğim": "gidilecek",
-        "tamamlayacağımı": "tamamlanacak",
-        "tamamlayacağım": "tamamlanacak",
-        "hazırlayacağımı": "hazırlanacak",
-        "hazırlayacağım": "hazırlanacak",
-        "göndereceğimi": "gönderilecek",
-        "göndereceğim": "gönderilecek",
-    }
-    for src, dst in replacements.items():
-        lowered = lowered.replace(src, dst)
-
-    if lowered.endswith("yapmak"):
-        lowered = lowered[: -len("yapmak")].strip() + " yapılacak"
-    if lowered.endswith("gitmek"):
-        lowered = lowered[: -len("gitmek")].strip() + " gidilecek"
+    lowered = _TITLE_FILLER_RE.sub(" ", lowered)
+    lowered = _SPACE_RE.sub(" ", lowered).strip()
+    lowered = _TITLE_VERB_RE.sub(lambda match: _TITLE_VERB_MAP[match.group(0)], lowered)
+
+    suffix = _TITLE_SUFFIX_RE.search(lowered)
+    if suffix:
+        lowered = lowered[: suffix.start()].strip() + " " + _TITLE_SUFFIX_MAP[suffix.group(1)]
 
     cleaned = lowered.strip().capitalize()
     if cleaned and cleaned[-1] not in ".!?":
@@ -114,57 +189,119 @@ def _normalize_task_title(title: str) -> str:
     return cleaned
 
 
-def _tokenize(text: str) -> set[str]:
-    return {token for token in re.split(r"[^\\wçğıöşüÇĞİÖŞÜ]+", text.lower()) if len(token) > 2}
+def _tokenize(lowered: str) -> frozenset[str]:
+    return frozenset(_WORD_RE.findall(lowered))
 
 
-def _extract_action_query(text: str, action_words: list[str]) -> str:
-    cleaned = text.lower()
-    for word in action_words:
-        cleaned = cleaned.replace(word, " ")
-    cleaned = re.sub(
-        r"\b(şu|bunu|şunu|bu|o|hatırlatma|hatirlatma|görev|görevi|hatırlatmayı|hatirlatmayi)\b",
-        " ",
-        cleaned,
-    )
-    cleaned = re.sub(r"#?\\d+", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+@lru_cache(maxsize=8)
+def _action_query_re(action_words: tuple[str, ...]) -> re.Pattern[str]:
+    # a run of action words, stopwords and ids (with the whitespace around them) collapses to one space
+    return re.compile(rf"(?:\s*(?:{_keyword_re(action_words).pattern}|{_ACTION_STOPWORDS}|#?\d+))+\s*|\s+")
 
 
-def _find_task_candidates(query: str, limit: int = 5) -> list[dict]:
-    tasks = list_tasks(limit=50)
-    if not tasks:
-        return []
-    if not query:
-        return tasks[:limit]
+def _extract_action_query(lowered: str, action_words: tuple[str, ...]) -> str:
+    return _action_query_re(action_words).sub(" ", lowered).strip()
+
+
+class _TaskIndex:
+    """Pending tasks with lowered titles and a token -> task id inverted index."""
+
+    def __init__(self) -> None:
+        self.version: tuple[int, int, int] | None = None
+        self.tasks: list[TaskRow] = []
+        self.by_id: dict[int, TaskRow] = {}
+        self.titles: dict[int, str] = {}
+        # title tokens are computed once per index build, not per query
+        self.tokens: dict[int, frozenset[str]] = {}
+        self.positions: dict[int, int] = {}
+        self.buckets: dict[str, set[int]] = {}
+
+    def refresh(self) -> tuple[int, int, int]:
+        version = tasks_version()
+        if version == self.version:
+            return version
+        self.tasks = list_tasks(limit=TASK_INDEX_LIMIT)
+        self.by_id = {task.id: task for task in self.tasks}
+        self.titles = {task.id: task.title.lower() for task in self.tasks}
+        self.tokens = {task_id: _tokenize(title) for task_id, title in self.titles.items()}
+        self.positions = {task.id: position for position, task in enumerate(self.tasks)}
+        self.buckets = {}
+        for task_id, tokens in self.tokens.items():
+            for token in tokens:
+                self.buckets.setdefault(token, set()).add(task_id)
+        self.version = version
+        return version
 
+
+_TASK_INDEX = _TaskIndex()
+
+
+@lru_cache(maxsize=128)
+def _candidate_ids(query: str, version: tuple[int, int, int], limit: int) -> tuple[int, ...]:
+    index = _TASK_INDEX
     query_tokens = _tokenize(query)
-    scored: list[tuple[int, dict]] = []
-    for task in tasks:
-        title = task["title"].lower()
-        score = 0
-        if query in title:
+    candidate_ids = set().union(*(index.buckets.get(token, ()) for token in query_tokens))
+    candidate_ids.update(task_id for task_id, title in index.titles.items() if query in title)
+
+    scored: list[tuple[int, bool, int, int]] = []
+    for task_id in candidate_ids:
+        score = len(query_tokens & index.tokens[task_id])
+        if query in index.titles[task_id]:
             score += 3
-        title_tokens = _tokenize(title)
-        score += len(query_tokens & title_tokens)
         if score > 0:
-            scored.append((score, task))
+            task = index.by_id[task_id]
+            scored.append((-score, task.due_at is None, index.positions[task_id], task_id))
+
+    scored.sort()
+    return tuple(task_id for *_, task_id in scored[:limit])
+
+
+def _find_task_candidates(query: str, limit: int = 5) -> list[TaskRow]:
+    version = _TASK_INDEX.refresh()
+    if not _TASK_INDEX.tasks:
+        return []
+    if not query:
+        return _TASK_INDEX.tasks[:limit]
+    return [_TASK_INDEX.by_id[task_id] for task_id in _candidate_ids(query, version, limit)]
+
+
+# telegram objects are immutable, so buttons and markups can be shared between messages
+_CANCEL_BUTTONS = {
+    "delete": InlineKeyboardButton("Vazgeç", callback_data="delete:cancel"),
+    "done": InlineKeyboardButton("Vazgeç", callback_data="done:cancel"),
+}
+_CONFIRM_LABELS = {"delete": "Sil", "done": "Tamamlandı"}
 
-    scored.sort(key=lambda item: (-item[0], item[1].get("due_at") is None))
-    return [task for _, task in scored[:limit]]
+
+@lru_cache(maxsize=512)
+def _confirm_markup(task_id: int, action: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(_CONFIRM_LABELS[action], callback_data=f"{action}:{task_id}"), _CANCEL_BUTTONS[action]]]
+    )
 
 
-async def _send_task_selection(message, tasks: list[dict], action: str) -> None:
+@lru_cache(maxsize=512)
+def _reminder_markup(task_id: int) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton("Tamamlandı", callback_data=f"done:{task_id}"),
+                InlineKeyboardButton("1 saat ertele", callback_data=f"snooze:{task_id}:60"),
+            ]
+        ]
+    )
+
+
+async def _send_task_selection(message, tasks: list[TaskRow], action: str) -> None:
     if not tasks:
         await message.reply_text("Eşleşen görev bulunamadı. /tasks ile listeden bakabilirsin.")
         return
     prefix = "delete" if action == "delete" else "done"
     keyboard = []
     for task in tasks:
-        label = f"#{task['id']} {_truncate(task['title'], 32)}"
-        keyboard.append([InlineKeyboardButton(label, callback_data=f"{prefix}_pick:{task['id']}")])
-    keyboard.append([InlineKeyboardButton("Vazgeç", callback_data=f"{prefix}:cancel")])
+        label = f"#{task.id} {_truncate(task.title, 32)}"
+        keyboard.append([InlineKeyboardButton(label, callback_data=f"{prefix}_pick:{task.id}")])
+    keyboard.append([_CANCEL_BUTTONS[prefix]])
     await message.reply_text("Hangisini seçeyim?", reply_markup=InlineKeyboardMarkup(keyboard))
 
 
@@ -173,16 +310,9 @@ async def _send_delete_confirmation(message, task_id: int) -> None:
     if not task:
         await message.reply_text("Görev bulunamadı.")
         return
-    keyboard = InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton("Sil", callback_data=f"delete:{task_id}"),
-                InlineKeyboardButton("Vazgeç", callback_data="delete:cancel"),
-            ]
-        ]
-    )
+    keyboard = _confirm_markup(task_id, "delete")
     await message.reply_text(
-        f"#{task_id} silinsin mi?\n{task['title']}",
+        f"#{task_id} silinsin mi?\n{task.title}",
         reply_markup=keyboard,
     )
 
@@ -192,24 +322,24 @@ async def _send_done_confirmation(message, task_id: int) -> None:
     if not task:
         await message.reply_text("Görev bulunamadı.")
         return
-    keyboard = InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton("Tamamlandı", callback_data=f"done:{task_id}"),
-                InlineKeyboardButton("Vazgeç", callback_data="done:cancel"),
-            ]
-        ]
-    )
+    keyboard = _confirm_markup(task_id, "done")
     await message.reply_text(
-        f"#{task_id} tamamlandı olarak işaretlensin mi?\n{task['title']}",
+        f"#{task_id} tamamlandı olarak işaretlensin mi?\n{task.title}",
         reply_markup=keyboard,
     )
 
 
 def _build_summary() -> str:
+    # rendered text only changes with the data or as "today" moves, so reuse it within a short bucket
+    now = now_local()
+    bucket = now.replace(minute=now.minute - now.minute % SUMMARY_CACHE_MINUTES, second=0, microsecond=0)
+    return _render_summary(tasks_version(), papers_version(), bucket.isoformat())
+
+
+@lru_cache(maxsize=1)
+def _render_summary(task_version: tuple[int, int, int], paper_version: int, bucket: str) -> str:
     now = now_local()
-    pending_total = count_tasks("pending")
-    done_total = count_tasks("done")
+    counts = summary_counts()
 
     start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     end = now.replace(hour=23, minute=59, second=59, microsecond=0)
@@ -217,12 +347,11 @@ def _build_summary() -> str:
     upcoming = list_tasks(limit=SUMMARY_TASK_LIMIT)
 
     since = to_utc_iso(now - timedelta(hours=24))
-    papers = list_papers_since(since, limit=SUMMARY_PAPER_LIMIT)
-    paper_total = count_papers()
+    papers, paper_total = summary_bundle(since, limit=SUMMARY_PAPER_LIMIT)
 
     lines = [
         f"📊 {BOT_NAME} Özeti",
-        f"Açık görev: {pending_total} | Tamamlanan: {done_total}",
+        f"Açık görev: {counts['pending']} | Tamamlanan: {counts['done']}",
     ]
     if today_tasks:
         lines.append("Bugün:")
@@ -238,7 +367,7 @@ def _build_summary() -> str:
     if papers:
         lines.append("Son makaleler:")
         for paper in papers:
-            score = paper.get("relevance_score")
+            score = paper["relevance_score"]
             score_text = f"{score:.0f}/100" if isinstance(score, (int, float)) else "skor yok"
             lines.append(f"• {paper['title']} ({score_text})")
     else:
@@ -248,48 +377,20 @@ def _build_summary() -> str:
     return "\n".join(lines)
 
 
-def _is_summary_request(text: str) -> bool:
-    lowered = text.lower()
-    return any(word in lowered for word in ["özet", "ozet", "summary", "rapor", "durum"])
-
-
-def _is_delete_request(text: str) -> bool:
-    lowered = text.lower()
-    return any(word in lowered for word in ["sil", "kaldır", "iptal et", "silmek"])
-
-
-def _is_complete_request(text: str) -> bool:
-    lowered = text.lower()
-    return any(word in lowered for word in ["tamamlandı", "tamamladım", "tamamla", "bitirdim", "bitti"])
+def _detect_intents(lowered: str) -> set[str]:
+    # every intent whose keyword occurs; handle_message applies the priority order
+    return {match.lastgroup for match in _INTENT_RE.finditer(lowered)}
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     ensure_defaults()
-    chat_id = _get_chat_id(update)
-    await update.message.reply_text(
-        f"Merhaba! Ben {BOT_NAME}. {BOT_ROLE}\n"
-        "Örnek: 'yarın saat 3'te danışman toplantısı var hatırlat' ya da 'bu hafta thesis proposal bitir'.\n"
-        "Komutlar: /tasks, /today, /week, /done <id>, /delete <id>, /snooze <id> 2 saat, /summary, /papers, /goals, /goal",
-    )
+    # registers the chat for reminders and digests on first contact
+    _get_chat_id(update)
+    await update.message.reply_text(START_TEXT)
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "Komutlar:\n"
-        "/tasks - tüm açık görevler\n"
-        "/today - bugünkü görevler\n"
-        "/week - bu haftaki görevler\n"
-        "/done <id> - görevi tamamla\n"
-        "/delete <id> - görevi sil\n"
-        "/snooze <id> 2 saat - ertele\n"
-        "/summary - görev ve makale özeti\n"
-        "/templates - örnek cümleler\n"
-        "/papers - yeni makaleler\n"
-        "/goals - yıllık hedefler\n"
-        "/goal <yıl> <hedef> - yeni hedef ekle\n"
-        "/scan - makale taramasını şimdi başlat\n"
-        "/read <id> - makale okundu olarak işaretle\n"
-    )
+    await update.message.reply_text(HELP_TEXT)
 
 
 async def tasks_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -364,8 +465,8 @@ async def snooze_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     base = now_local()
-    if task.get("due_at"):
-        base = from_iso_to_local(task["due_at"])
+    if task.due_at:
+        base = from_iso_to_local(task.due_at)
     new_due = base + timedelta(minutes=minutes)
     snooze_task(task_id, new_due)
     await update.message.reply_text(f"#{task_id} yeni zaman: {format_dt_local(new_due)}")
@@ -380,10 +481,10 @@ async def papers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     lines = ["Yeni makaleler:"]
     for paper in papers:
-        score = paper.get("relevance_score")
+        score = paper["relevance_score"]
         score_text = f"{score:.0f}/100" if isinstance(score, (int, float)) else "skor yok"
         lines.append(f"#{paper['id']} • {paper['title']} ({score_text})")
-        if paper.get("url"):
+        if paper["url"]:
             lines.append(paper["url"])
     await update.message.reply_text("\n".join(lines))
 
@@ -393,9 +494,7 @@ async def summary_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 
 async def templates_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    lines = ["Örnek kalıplar:"]
-    lines.extend(f"• {example}" for example in TEMPLATE_EXAMPLES)
-    await update.message.reply_text("\n".join(lines))
+    await update.message.reply_text(TEMPLATES_TEXT)
 
 
 async def goals_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -459,38 +558,49 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         return
 
-    if _is_summary_request(text):
+    # "#12 sil" / "12 tamamla": act on the id without scanning for intents
+    id_only = _ID_ONLY_RE.match(lowered)
+    if id_only:
+        task_id = int(id_only.group(1))
+        if id_only.group(2) in DELETE_WORDS:
+            await _send_delete_confirmation(update.message, task_id)
+        else:
+            await _send_done_confirmation(update.message, task_id)
+        return
+
+    intents = _detect_intents(lowered)
+    if "summary" in intents:
         await update.message.reply_text(_build_summary())
         return
 
-    if "şablon" in lowered or "template" in lowered or "örnek" in lowered:
+    if "template" in intents:
         await templates_command(update, context)
         return
 
-    if _is_delete_request(text):
-        match = re.search(r"#?(\\d+)", text)
+    if "delete" in intents:
+        match = _ID_RE.search(text)
         if match:
             task_id = int(match.group(1))
             await _send_delete_confirmation(update.message, task_id)
             return
-        query = _extract_action_query(text, ["sil", "kaldır", "iptal et", "silmek"])
+        query = _extract_action_query(lowered, DELETE_WORDS)
         candidates = _find_task_candidates(query)
         if len(candidates) == 1:
-            await _send_delete_confirmation(update.message, candidates[0]["id"])
+            await _send_delete_confirmation(update.message, candidates[0].id)
         else:
             await _send_task_selection(update.message, candidates, "delete")
         return
 
-    if _is_complete_request(text):
-        match = re.search(r"#?(\\d+)", text)
+    if "done" in intents:
+        match = _ID_RE.search(text)
         if match:
             task_id = int(match.group(1))
             await _send_done_confirmation(update.message, task_id)
             return
-        query = _extract_action_query(text, ["tamamla", "tamamlandı", "tamamladım", "bitirdim", "bitti"])
+        query = _extract_action_query(lowered, COMPLETE_WORDS)
         candidates = _find_task_candidates(query)
         if len(candidates) == 1:
-            await _send_done_confirmation(update.message, candidates[0]["id"])
+            await _send_done_confirmation(update.message, candidates[0].id)
         else:
             await _send_task_selection(update.message, candidates, "done")
         return
@@ -508,13 +618,13 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         return
 
-    if "listele" in lowered or "görev" in lowered or "liste" in lowered:
+    if "list" in intents:
         tasks = list_tasks()
         await update.message.reply_text(_format_tasks(tasks))
         return
 
-    if "hedef" in lowered:
-        match = re.search(r"(20\\d{2})", text)
+    if "goal" in intents:
+        match = _YEAR_RE.search(text)
         if match:
             year = int(match.group(1))
             title = text.replace(match.group(1), "").strip()
@@ -523,15 +633,15 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 await update.message.reply_text("Hedef eklendi ✅")
                 return
 
-    if any(word in lowered for word in ["merhaba", "selam", "naber", "nasılsın", "nasilsin"]):
+    if "greet" in intents:
         await update.message.reply_text(f"Merhaba! Ben {BOT_NAME}. Sana nasıl yardımcı olabilirim?")
         return
 
-    if any(word in lowered for word in ["teşekkür", "tesekkur", "sağ ol", "sag ol"]):
+    if "thanks" in intents:
         await update.message.reply_text("Rica ederim. Başka bir şey var mı?")
         return
 
-    if any(word in lowered for word in ["kimsin", "nesin", "ne yaparsın"]):
+    if "whoami" in intents:
         await update.message.reply_text(f"Ben {BOT_NAME}. Görevlerini ve araştırma özetlerini yönetiyorum.")
         return
 
@@ -551,37 +661,74 @@ async def reminder_job(context: ContextTypes.DEFAULT_TYPE) -> None:
     if not chat_id:
         return
 
+    sends = []
     for task in due_tasks:
         due_text = ""
-        if task.get("due_at"):
-            due_text = format_dt_local(from_iso_to_local(task["due_at"]))
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton("Tamamlandı", callback_data=f"done:{task['id']}"),
-                    InlineKeyboardButton("1 saat ertele", callback_data=f"snooze:{task['id']}:60"),
-                ]
-            ]
-        )
+        if task.due_at:
+            due_text = format_iso_local(task.due_at)
+        keyboard = _reminder_markup(task.id)
         message = (
             "⏰ Hatırlatma\n"
-            f"Görev: {task['title']}\n"
+            f"Görev: {task.title}\n"
             f"Zaman: {due_text or 'Belirtilmedi'}\n"
             "İstersen aşağıdan işlem seçebilirsin."
         )
-        await context.bot.send_message(
-            chat_id=chat_id,
-            text=message,
-            reply_markup=keyboard,
+        sends.append(
+            context.bot.send_message(
+                chat_id=chat_id,
+                text=message,
+                reply_markup=keyboard,
+            )
         )
-        set_reminded(task["id"], now_iso)
+
+    results = await asyncio.gather(*sends, return_exceptions=True)
+    sent_ids = []
+    for task, result in zip(due_tasks, results):
+        if isinstance(result, Exception):
+            # leave reminded_at empty so the next run retries this task
+            logging.getLogger(__name__).warning("Reminder for task %s failed: %s", task.id, result)
+        else:
+            sent_ids.append(task.id)
+    bulk_set_reminded(sent_ids, now_iso)
 
 
 async def scan_job(context: ContextTypes.DEFAULT_TYPE) -> None:
-    results = scan_papers()
+    if _SCAN_LOCK.locked():
+        logging.getLogger(__name__).info("Paper scan skipped: a scan is already running")
+        return
+    async with _SCAN_LOCK:
+        # the scan does blocking HTTP and Gemini calls; keep the event loop free for other handlers
+        results = await asyncio.to_thread(scan_papers)
     logging.getLogger(__name__).info("Paper scan completed: %s", results)
 
 
+def _format_digest(papers: list[sqlite3.Row]) -> list[str]:
+    # pages stay under Telegram's message limit; only the summary of an oversized entry is cut, never the link
+    pages: list[str] = []
+    buf = [DIGEST_HEADER]
+    buf_len = len(DIGEST_HEADER)
+    for paper in papers:
+        score = paper["relevance_score"]
+        score_text = f"{score:.0f}/100" if isinstance(score, (int, float)) else "skor yok"
+        head = f"• {_truncate(paper['title'], DIGEST_TITLE_LIMIT)} ({score_text})"
+        tail = [paper["url"]] if paper["url"] else []
+        block = [head]
+        if paper["summary"]:
+            # sized so the entry still fits on a page that starts with the header
+            room = DIGEST_PAGE_LIMIT - len(DIGEST_HEADER) - len(head) - sum(len(line) + 1 for line in tail) - 2
+            if room > 1:
+                block.append(_truncate(f"  {paper['summary']}", room))
+        text = "\n".join(block + tail)
+        if buf and buf_len + len(text) + 1 > DIGEST_PAGE_LIMIT:
+            pages.append("\n".join(buf))
+            buf, buf_len = [], 0
+        buf.append(text)
+        buf_len += len(text) + 1
+    if buf:
+        pages.append("\n".join(buf))
+    return pages
+
+
 async def digest_job(context: ContextTypes.DEFAULT_TYPE) -> None:
     chat_id = get_setting("telegram_chat_id")
     if not chat_id:
@@ -594,31 +741,18 @@ async def digest_job(context: ContextTypes.DEFAULT_TYPE) -> None:
         await context.bot.send_message(chat_id=chat_id, text="Bugün yeni makale yok gibi görünüyor.")
         return
 
-    lines = ["📌 Günlük makale özeti:"]
-    for paper in papers:
-        score = paper.get("relevance_score")
-        score_text = f"{score:.0f}/100" if isinstance(score, (int, float)) else "skor yok"
-        summary = paper.get("summary") or ""
-        lines.append(f"• {paper['title']} ({score_text})")
-        if summary:
-            lines.append(f"  {summary}")
-        if paper.get("url"):
-            lines.append(paper["url"])
-    message = "\n".join(lines)
-
-    # Telegram message length limit safety
-    if len(message) > 3800:
-        parts = ["\n".join(lines[:10]), "\n".join(lines[10:])]
-        for part in parts:
-            if part.strip():
-                await context.bot.send_message(chat_id=chat_id, text=part)
-    else:
-        await context.bot.send_message(chat_id=chat_id, text=message)
+    # sent one after another so the pages arrive in order
+    for page in _format_digest(papers):
+        await context.bot.send_message(chat_id=chat_id, text=page)
 
 
 async def manual_scan(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text("Tarama başlıyor...")
-    results = scan_papers()
+    if _SCAN_LOCK.locked():
+        await update.message.reply_text("Tarama zaten sürüyor, biraz sonra tekrar deneyin.")
+        return
+    async with _SCAN_LOCK:
+        await update.message.reply_text("Tarama başlıyor...")
+        results = await asyncio.to_thread(scan_papers)
     await update.message.reply_text(
         f"Tarama tamamlandı. Yeni: {results['new_papers']}, analiz edilen: {results['analyzed']}"
     )
@@ -660,76 +794,93 @@ def build_application():
     return app
 
 
-async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    query = update.callback_query
-    await query.answer()
+def _try_int(value: str) -> int | None:
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
-    data = query.data or ""
-    if data in {"delete:cancel", "done:cancel"}:
-        await query.edit_message_text("İşlem iptal edildi.")
-        return
 
-    if data.startswith("delete_pick:"):
-        try:
-            task_id = int(data.split(":", 1)[1])
-        except ValueError:
-            await query.edit_message_text("Geçersiz işlem.")
-            return
-        await _send_delete_confirmation(query.message, task_id)
+async def _cb_delete_pick(query, rest: str) -> None:
+    task_id = _try_int(rest)
+    if task_id is None:
+        await query.edit_message_text("Geçersiz işlem.")
         return
+    await _send_delete_confirmation(query.message, task_id)
 
-    if data.startswith("done_pick:"):
-        try:
-            task_id = int(data.split(":", 1)[1])
-        except ValueError:
-            await query.edit_message_text("Geçersiz işlem.")
-            return
-        await _send_done_confirmation(query.message, task_id)
+
+async def _cb_done_pick(query, rest: str) -> None:
+    task_id = _try_int(rest)
+    if task_id is None:
+        await query.edit_message_text("Geçersiz işlem.")
         return
+    await _send_done_confirmation(query.message, task_id)
 
-    if data.startswith("delete:"):
-        try:
-            task_id = int(data.split(":", 1)[1])
-        except ValueError:
-            await query.edit_message_text("Geçersiz işlem.")
-            return
 
-        if delete_task(task_id):
-            await query.edit_message_text(f"#{task_id} silindi 🗑️")
-        else:
-            await query.edit_message_text("Görev bulunamadı.")
+async def _cb_delete(query, rest: str) -> None:
+    if rest == "cancel":
+        await query.edit_message_text("İşlem iptal edildi.")
+        return
+    task_id = _try_int(rest)
+    if task_id is None:
+        await query.edit_message_text("Geçersiz işlem.")
         return
 
-    if data.startswith("done:"):
-        try:
-            task_id = int(data.split(":", 1)[1])
-        except ValueError:
-            await query.edit_message_text("Geçersiz işlem.")
-            return
+    if delete_task(task_id):
+        await query.edit_message_text(f"#{task_id} silindi 🗑️")
+    else:
+        await query.edit_message_text("Görev bulunamadı.")
 
-        if mark_done(task_id):
-            await query.edit_message_text(f"#{task_id} tamamlandı ✅")
-        else:
-            await query.edit_message_text("Görev bulunamadı.")
+
+async def _cb_done(query, rest: str) -> None:
+    if rest == "cancel":
+        await query.edit_message_text("İşlem iptal edildi.")
+        return
+    task_id = _try_int(rest)
+    if task_id is None:
+        await query.edit_message_text("Geçersiz işlem.")
         return
 
-    if data.startswith("snooze:"):
-        try:
-            _, task_id_text, minutes_text = data.split(":", 2)
-            task_id = int(task_id_text)
-            minutes = int(minutes_text)
-        except ValueError:
-            await query.edit_message_text("Geçersiz işlem.")
-            return
+    if mark_done(task_id):
+        await query.edit_message_text(f"#{task_id} tamamlandı ✅")
+    else:
+        await query.edit_message_text("Görev bulunamadı.")
 
-        task = get_task(task_id)
-        if not task:
-            await query.edit_message_text("Görev bulunamadı.")
-            return
-        base = now_local()
-        if task.get("due_at"):
-            base = from_iso_to_local(task["due_at"])
-        new_due = base + timedelta(minutes=minutes)
-        snooze_task(task_id, new_due)
-        await query.edit_message_text(f"#{task_id} yeni zaman: {format_dt_local(new_due)}")
+
+async def _cb_snooze(query, rest: str) -> None:
+    task_id_text, _, minutes_text = rest.partition(":")
+    task_id = _try_int(task_id_text)
+    minutes = _try_int(minutes_text)
+    if task_id is None or minutes is None:
+        await query.edit_message_text("Geçersiz işlem.")
         return
+
+    task = get_task(task_id)
+    if not task:
+        await query.edit_message_text("Görev bulunamadı.")
+        return
+    base = now_local()
+    if task.due_at:
+        base = from_iso_to_local(task.due_at)
+    new_due = base + timedelta(minutes=minutes)
+    snooze_task(task_id, new_due)
+    await query.edit_message_text(f"#{task_id} yeni zaman: {format_dt_local(new_due)}")
+
+
+_CALLBACK_TABLE = {
+    "delete": _cb_delete,
+    "done": _cb_done,
+    "snooze": _cb_snooze,
+    "delete_pick": _cb_delete_pick,
+    "done_pick": _cb_done_pick,
+}
+
+
+async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    query = update.callback_query
+    await query.answer()
+
+    prefix, _, rest = (query.data or "").partition(":")
+    handler = _CALLBACK_TABLE.get(prefix)
+    if handler:
+        await handler(query, rest)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import datetime, time, timedelta
+from functools import lru_cache
 
 import dateparser
 from dateparser.search import search_dates
@@ -9,7 +10,11 @@ from dateparser.search import search_dates
 from .utils import end_of_month, end_of_week, get_tz
 
 
-TASK_KEYWORDS = {
+_FILLER_RE = re.compile(r"\b(hatırlat|hatirlat|lütfen|lutfen)\b", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+_DURATION_RE = re.compile(r"(\d+)\s*(dakika|dk|saat|gün|gun)")
+
+TASK_KEYWORDS = frozenset({
     "hatırlat",
     "hatirlat",
     "toplantı",
@@ -28,54 +33,166 @@ TASK_KEYWORDS = {
     "makale",
     "okuma",
     "okumak",
+})
+# keywords are stems ("toplantı" in "toplantısı"), so match substrings rather than whole tokens
+_TASK_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in sorted(TASK_KEYWORDS, key=len, reverse=True)))
+
+
+_DAY_OFFSETS = {"bugün": 0, "bugun": 0, "yarın": 1, "yarin": 1, "öbür gün": 2, "obur gun": 2}
+_WEEKDAYS = {
+    "pazartesi": 0,
+    "salı": 1,
+    "sali": 1,
+    "çarşamba": 2,
+    "carsamba": 2,
+    "perşembe": 3,
+    "persembe": 3,
+    "cuma": 4,
+    "cumartesi": 5,
+    "pazar": 6,
 }
+_PERIODS = {"bu hafta": end_of_week, "this week": end_of_week, "bu ay": end_of_month, "this month": end_of_month}
+
+
+def _alternation(words) -> str:
+    return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+def _fold(word: str) -> str:
+    # IGNORECASE lets I/İ/ı match each other, but "İ".lower() is "i̇"; key the tables on a plain i
+    return word.lower().replace("i\u0307", "i").replace("ı", "i")
+
+
+_DAY_KEYS = {_fold(word): offset for word, offset in _DAY_OFFSETS.items()}
+_WEEKDAY_KEYS = {_fold(word): weekday for word, weekday in _WEEKDAYS.items()}
+_PERIOD_KEYS = {_fold(word): resolve for word, resolve in _PERIODS.items()}
+
+
+# the everyday grammar: bugün/yarın/<weekday> [günü], HH:MM, "saat N", bu hafta/bu ay,
+# each optionally followed by a case suffix ("yarına", "cumaya", "15:00'te", "saat 3'te")
+_FAST_DATE_RE = re.compile(
+    rf"(?<!\w)(?:(?P<day>{_alternation(_DAY_OFFSETS)})"
+    rf"|(?P<weekday>{_alternation(_WEEKDAYS)})(?:\s+günü)?"
+    r"|(?:saat\s+)?(?P<hour>[01]?\d|2[0-3]):(?P<minute>[0-5]\d)"
+    r"|saat\s+(?P<bare_hour>[01]?\d|2[0-3])"
+    rf"|(?P<period>{_alternation(_PERIODS)}))"
+    r"(?:'?(?:y?[ae]|n?[dt][ae]n?))?(?!\w)",
+    re.IGNORECASE,
+)
+# dateparser has no notion of "this week"/"this month"; checked when it finds nothing
+_PERIOD_RE = re.compile(_alternation(_PERIODS), re.IGNORECASE)
+# anything date-like left over means the fast path would misread the text
+_DATE_HINT_RE = re.compile(
+    r"\d|\b(?:saat|sonra|önce|sabah|öğle|akşam|gece|hafta|gelecek|önümüzdeki"
+    r"|ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)",
+    re.IGNORECASE,
+)
+
+
+def _fast_parse(text: str, now: datetime) -> tuple[datetime, str] | None:
+    matches = list(_FAST_DATE_RE.finditer(text))
+    if not matches:
+        return None
+    found = {match.lastgroup: match for match in matches}
+    if len(found) != len(matches):
+        return None
+    if "period" in found and len(found) > 1:
+        return None
+    if ("day" in found and "weekday" in found) or ("minute" in found and "bare_hour" in found):
+        return None
+    remainder = _FAST_DATE_RE.sub(" ", text)
+    if _DATE_HINT_RE.search(remainder):
+        return None
+
+    if "period" in found:
+        return _PERIOD_KEYS[_fold(found["period"].group("period"))](now), remainder
+
+    day = now.date()
+    if "day" in found:
+        day += timedelta(days=_DAY_KEYS[_fold(found["day"].group("day"))])
+    elif "weekday" in found:
+        day += timedelta(days=(_WEEKDAY_KEYS[_fold(found["weekday"].group("weekday"))] - now.weekday()) % 7)
+
+    if "minute" in found:
+        at = time(int(found["minute"].group("hour")), int(found["minute"].group("minute")))
+    elif "bare_hour" in found:
+        hour = int(found["bare_hour"].group("bare_hour"))
+        if hour <= 12:
+            # "saat 3" may be 03:00 or 15:00; leave it to dateparser (which asks when unsure)
+            return None
+        at = time(hour)
+    elif "weekday" in found:
+        # dateparser puts a bare weekday at midnight
+        at = time(0, 0)
+    else:
+        at = time(now.hour, now.minute)
+
+    due_at = datetime.combine(day, at, tzinfo=now.tzinfo)
+    if due_at <= now and "day" not in found:
+        # a bare time or today's weekday that already passed means the next one
+        due_at += timedelta(days=7 if "weekday" in found else 1)
+    return due_at, remainder
 
 
 def _strip_filler(text: str) -> str:
-    cleaned = re.sub(r"\b(hatırlat|hatirlat|lütfen|lutfen)\b", "", text, flags=re.IGNORECASE)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = _FILLER_RE.sub("", text)
+    return _SPACE_RE.sub(" ", cleaned).strip()
 
 
-def parse_task_text(text: str, now: datetime) -> tuple[str, datetime | None]:
+@lru_cache(maxsize=1024)
+def _search_dates_cached(text: str, base_iso: str) -> tuple[str, str] | None:
+    # keyed on a minute-resolution base so repeated replies ("yarın 15:00") skip dateparser
     tz = get_tz()
     settings = {
         "PREFER_DATES_FROM": "future",
-        "RELATIVE_BASE": now,
+        "RELATIVE_BASE": datetime.fromisoformat(base_iso),
         "RETURN_AS_TIMEZONE_AWARE": True,
         "TIMEZONE": tz.key,
     }
-
     found = search_dates(text, languages=["tr"], settings=settings)
+    if not found:
+        return None
+    # take the last date-like phrase
+    phrase, dt = found[-1]
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=tz)
+    return phrase, dt.isoformat()
+
+
+def parse_task_text(text: str, now: datetime) -> tuple[str, datetime | None]:
+    fast = _fast_parse(text, now)
+    if fast:
+        due_at, cleaned = fast
+        cleaned = cleaned.strip()
+        title = _strip_filler(cleaned) if cleaned else text.strip()
+        return title, due_at
+
+    base = now.replace(second=0, microsecond=0)
+    found = _search_dates_cached(text, base.isoformat())
     due_at = None
     cleaned = text
 
     if found:
-        # take the last date-like phrase
-        phrase, dt = found[-1]
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=tz)
-        due_at = dt
+        phrase, dt_iso = found
+        due_at = datetime.fromisoformat(dt_iso).astimezone(get_tz())
         cleaned = text.replace(phrase, " ").strip()
 
-    lowered = text.lower()
     if due_at is None:
-        if "bu hafta" in lowered or "this week" in lowered:
-            due_at = end_of_week(now)
-        elif "bu ay" in lowered or "this month" in lowered:
-            due_at = end_of_month(now)
+        period = _PERIOD_RE.search(text)
+        if period:
+            due_at = _PERIOD_KEYS[_fold(period.group())](now)
 
     title = _strip_filler(cleaned) if cleaned else text.strip()
     return title, due_at
 
 
 def looks_like_task(text: str) -> bool:
-    lowered = text.lower()
-    return any(keyword in lowered for keyword in TASK_KEYWORDS)
+    return _TASK_KEYWORD_RE.search(text.lower()) is not None
 
 
 def parse_duration(text: str) -> int | None:
     # returns minutes
-    match = re.search(r"(\d+)\s*(dakika|dk|saat|gün|gun)", text.lower())
+    match = _DURATION_RE.search(text.lower())
     if not match:
         return None
     value = int(match.group(1))
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import calendar
 from datetime import datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from .config import load_config
 
 
 CONFIG = load_config()
+_UTC = ZoneInfo("UTC")
 
 
+@lru_cache(maxsize=1)
 def get_tz() -> ZoneInfo:
     return ZoneInfo(CONFIG.timezone)
 
@@ -17,16 +21,20 @@ def now_local() -> datetime:
     return datetime.now(tz=get_tz())
 
 
+# keyed on the datetime itself: an epoch-second key would drop the microseconds from the output
+@lru_cache(maxsize=512)
 def to_utc_iso(dt: datetime) -> str:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=get_tz())
-    return dt.astimezone(ZoneInfo("UTC")).isoformat()
+    return dt.astimezone(_UTC).isoformat()
 
 
+# stored timestamps repeat across renders and datetimes are immutable, so parses are memoised
+@lru_cache(maxsize=4096)
 def from_iso_to_local(value: str) -> datetime:
     dt = datetime.fromisoformat(value)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=_UTC)
     return dt.astimezone(get_tz())
 
 
@@ -36,6 +44,11 @@ def format_dt_local(dt: datetime | None) -> str:
     return dt.strftime("%d %b %Y %H:%M")
 
 
+@lru_cache(maxsize=4096)
+def format_iso_local(value: str) -> str:
+    return format_dt_local(from_iso_to_local(value))
+
+
 def parse_time_str(value: str) -> time:
     parts = value.strip().split(":")
     hour = int(parts[0])
@@ -51,10 +64,6 @@ def end_of_week(base: datetime) -> datetime:
 
 
 def end_of_month(base: datetime) -> datetime:
-    # move to next month first day then back one minute
-    if base.month == 12:
-        next_month = base.replace(year=base.year + 1, month=1, day=1)
-    else:
-        next_month = base.replace(month=base.month + 1, day=1)
-    end = next_month - timedelta(minutes=1)
-    return end.replace(second=0, microsecond=0)
+    # last day 23:59
+    last_day = calendar.monthrange(base.year, base.month)[1]
+    return base.replace(day=last_day, hour=23, minute=59, second=0, microsecond=0)
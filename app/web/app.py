@@ -1,20 +1,55 @@
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
 
-from flask import Flask, redirect, render_template, request, url_for
+from flask import Flask, jsonify, make_response, redirect, render_template, request, stream_template, url_for
+from flask_caching import Cache
+from flask_compress import Compress
 
 from ..config import load_config
 from ..db import ensure_defaults, get_setting, set_setting
 from ..task_parser import parse_task_text
 from ..utils import format_dt_local, from_iso_to_local, now_local, to_utc_iso
 from ..services.goal_service import create_goal, list_goals
-from ..services.paper_service import count_papers, count_tasks, list_papers, list_papers_since, mark_read
-from ..services.stats_service import get_read_streak
-from ..services.task_service import create_task, delete_task, list_tasks, list_tasks_between, mark_done
+from ..services.paper_service import iter_papers, list_papers, list_papers_since, mark_read, mark_read_many
+from ..services.stats_service import get_dashboard_counts, get_read_streak
+from ..services.task_service import (
+    create_task,
+    delete_task,
+    delete_task_many,
+    list_tasks,
+    list_tasks_for_dashboard,
+    mark_done,
+    mark_done_many,
+)
 
 
 CONFIG = load_config()
+DASHBOARD_CACHE_SECONDS = 30
+LIST_CACHE_SECONDS = 60
+PAPERS_PAGE_LIMIT = 60
+_YEAR_RE = re.compile(r"^(?:19|20)\d{2}$")
+# pages not listed here are revalidated on every visit, which the ETag turns into a 304.
+# the streamed /papers list stays no-cache: it has no ETag, and a max-age would keep showing
+# a paper as unread after "Okundu" redirects back to it. only the client-render shell is static.
+_CACHE_CONTROL = {"stats": "public, max-age=30, stale-while-revalidate=120"}
+_PAPERS_SHELL_CACHE_CONTROL = "public, max-age=300"
+# Flask-Compress sends ETags out as "<tag>:<encoding>"
+_ETAG_ENCODING_RE = re.compile(r':[a-z]+"')
+
+# shared across requests: async views run on a fresh event loop each time, whose default executor would respawn threads
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="web-db")
+
+# kept on disk so every gunicorn worker sees the same entries; views that change data clear it,
+# which makes edits show up on the next page load whichever worker serves it
+cache = Cache()
+# fallback when no proxy compresses in front of us (see nginx/research-assistant.conf)
+compress = Compress()
 
 
 def create_app() -> Flask:
@@ -23,22 +58,61 @@ def create_app() -> Flask:
     app.config["WEB_HOST"] = CONFIG.web_host
     app.config["WEB_PORT"] = CONFIG.web_port
     app.secret_key = CONFIG.web_secret_key
+    cache.init_app(
+        app,
+        config={
+            "CACHE_TYPE": "FileSystemCache",
+            "CACHE_DIR": str(CONFIG.data_dir / "web_cache"),
+            "CACHE_DEFAULT_TIMEOUT": DASHBOARD_CACHE_SECONDS,
+        },
+    )
+    # streamed pages would be buffered whole before compressing; they go out as is
+    app.config["COMPRESS_STREAMS"] = False
+    # registered before conditional_response, so its hook runs after ours and 304s skip compression
+    compress.init_app(app)
+
+    @app.before_request
+    def strip_etag_encoding():
+        # compare revalidations against the plain tag that views and send_file compute
+        value = request.environ.get("HTTP_IF_NONE_MATCH")
+        if value and ":" in value:
+            request.environ["HTTP_IF_NONE_MATCH"] = _ETAG_ENCODING_RE.sub('"', value)
+
+    # url building walks the url map; the same handful of links is rendered on every page
+    @lru_cache(maxsize=4096)
+    def _cached_url_for(script_root: str, endpoint: str, **values) -> str:
+        return url_for(endpoint, **values)
+
+    def _curl(endpoint: str, **values) -> str:
+        if values.get("_external"):
+            return url_for(endpoint, **values)
+        return _cached_url_for(request.script_root, endpoint, **values)
+
+    app.jinja_env.globals["url_for"] = _curl
+
+    @app.template_filter("localdt")
+    def localdt(value: datetime | None) -> str:
+        return format_dt_local(value) if value else "(tarih yok)"
+
+    # the template set is small and fixed: keep every compiled template and compile them at boot
+    app.jinja_env.cache = {}
+    for name in app.jinja_env.list_templates(extensions=["html"]):
+        app.jinja_env.get_template(name)
 
     @app.route("/")
-    def dashboard():
+    @cache.cached(timeout=DASHBOARD_CACHE_SECONDS)
+    async def dashboard():
         now = now_local()
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=0)
-        today_tasks = list_tasks_between(to_utc_iso(start), to_utc_iso(end))
-        pending_tasks = list_tasks(limit=8)
-        streak = get_read_streak()
-        recent_papers = list_papers_since(to_utc_iso(now - timedelta(hours=24)), limit=5)
-        stats = {
-            "pending_tasks": count_tasks("pending"),
-            "done_tasks": count_tasks("done"),
-            "new_papers": count_papers("new"),
-            "read_papers": count_papers("read"),
-        }
+        # day bounds repeat all day, so these conversions are served from to_utc_iso's cache
+        start_iso = to_utc_iso(now.replace(hour=0, minute=0, second=0, microsecond=0))
+        end_iso = to_utc_iso(now.replace(hour=23, minute=59, second=59, microsecond=0))
+        since_iso = to_utc_iso(now - timedelta(hours=24))
+        (today_tasks, pending_tasks), streak, recent_papers, stats = await asyncio.gather(
+            _in_thread(list_tasks_for_dashboard, start_iso, end_iso, pending_limit=8),
+            _in_thread(get_read_streak),
+            _in_thread(list_papers_since, since_iso, limit=5),
+            _in_thread(get_dashboard_counts),
+        )
         return render_template(
             "dashboard.html",
             now=now,
@@ -56,33 +130,68 @@ def create_app() -> Flask:
             if text:
                 title, due_at = parse_task_text(text, now_local())
                 create_task(title, due_at, source="web")
-            return redirect(url_for("tasks"))
+                cache.clear()
+            return redirect(_curl("tasks"))
 
-        tasks_list = list_tasks(limit=50)
-        return render_template("tasks.html", tasks=tasks_list, format_dt_local=_format_dt)
+        # convert once up front; the template only formats
+        rows = [(task, from_iso_to_local(task.due_at) if task.due_at else None) for task in list_tasks(limit=50)]
+        return render_template("tasks.html", tasks=rows)
 
     @app.route("/tasks/<int:task_id>/done", methods=["POST"])
     def task_done(task_id: int):
         mark_done(task_id)
-        return redirect(url_for("tasks"))
+        cache.clear()
+        return redirect(_curl("tasks"))
 
     @app.route("/tasks/<int:task_id>/delete", methods=["POST"])
     def task_delete(task_id: int):
         delete_task(task_id)
-        return redirect(url_for("tasks"))
+        cache.clear()
+        return redirect(_curl("tasks"))
+
+    @app.route("/tasks/done", methods=["POST"])
+    def tasks_done_many():
+        if mark_done_many(request.form.getlist("task_ids", type=int)):
+            cache.clear()
+        return redirect(_curl("tasks"))
+
+    @app.route("/tasks/delete", methods=["POST"])
+    def tasks_delete_many():
+        if delete_task_many(request.form.getlist("task_ids", type=int)):
+            cache.clear()
+        return redirect(_curl("tasks"))
 
     @app.route("/papers")
     def papers():
+        if CONFIG.web_client_render:
+            # static shell; the list comes from /api/papers and filter switches stay in the browser
+            response = make_response(render_template("papers.html", client_render=True))
+            response.headers["Cache-Control"] = _PAPERS_SHELL_CACHE_CONTROL
+            return response
+        # streamed rather than cached: the first cards go out while later rows are still being read
         status = request.args.get("status")
-        papers_list = list_papers(status=status, limit=60)
-        return render_template("papers.html", papers=papers_list)
+        return stream_template("papers.html", papers=iter_papers(status=status, limit=PAPERS_PAGE_LIMIT))
+
+    @app.route("/api/papers")
+    def api_papers():
+        status = request.args.get("status") or None
+        return jsonify([dict(row) for row in list_papers(status=status, limit=PAPERS_PAGE_LIMIT)])
 
     @app.route("/papers/<int:paper_id>/read", methods=["POST"])
     def paper_read(paper_id: int):
         mark_read(paper_id, to_utc_iso(now_local()))
-        return redirect(url_for("papers"))
+        cache.clear()
+        return redirect(_curl("papers"))
+
+    @app.route("/papers/read", methods=["POST"])
+    def papers_read_many():
+        # one timestamp and one UPDATE for the whole selection
+        if mark_read_many(request.form.getlist("paper_ids", type=int), to_utc_iso(now_local())):
+            cache.clear()
+        return redirect(_curl("papers"))
 
     @app.route("/stats")
+    @cache.cached(timeout=LIST_CACHE_SECONDS, query_string=True)
     def stats():
         streak = get_read_streak()
         return render_template("stats.html", streak=streak)
@@ -92,9 +201,9 @@ def create_app() -> Flask:
         if request.method == "POST":
             title = request.form.get("goal_title", "").strip()
             year_text = request.form.get("goal_year", "").strip()
-            if title and year_text.isdigit():
+            if title and _YEAR_RE.match(year_text):
                 create_goal(title, int(year_text))
-            return redirect(url_for("goals"))
+            return redirect(_curl("goals"))
 
         goals_list = list_goals()
         return render_template("goals.html", goals=goals_list)
@@ -108,7 +217,7 @@ def create_app() -> Flask:
                 set_setting("thesis_topic", thesis_topic)
             if keywords:
                 set_setting("paper_keywords", keywords)
-            return redirect(url_for("settings"))
+            return redirect(_curl("settings"))
 
         return render_template(
             "settings.html",
@@ -116,10 +225,19 @@ def create_app() -> Flask:
             paper_keywords=get_setting("paper_keywords") or "",
         )
 
+    @app.after_request
+    def conditional_response(response):
+        if request.method != "GET" or response.status_code != 200 or request.endpoint == "static":
+            return response
+        response.headers.setdefault("Cache-Control", _CACHE_CONTROL.get(request.endpoint, "no-cache"))
+        if response.is_streamed:
+            return response
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+        return response.make_conditional(request)
+
     return app
 
 
-def _format_dt(iso_value: str | None) -> str:
-    if not iso_value:
-        return "(tarih yok)"
-    return format_dt_local(from_iso_to_local(iso_value))
+async def _in_thread(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DB_EXECUTOR, partial(func, *args, **kwargs))
@@ -0,0 +1,63 @@
+(function () {
+  const grid = document.getElementById("paper-grid");
+  const card = document.getElementById("paper-card");
+  if (!grid || !card) return;
+
+  function render(papers) {
+    const items = papers.map((paper) => {
+      const node = card.content.firstElementChild.cloneNode(true);
+      node.querySelector("h3").textContent = paper.title;
+      if (paper.relevance_score) {
+        const badge = node.querySelector(".badge");
+        badge.textContent = Math.round(paper.relevance_score) + "/100";
+        badge.hidden = false;
+      }
+      if (paper.summary) {
+        const summary = node.querySelector("p");
+        summary.textContent = paper.summary;
+        summary.hidden = false;
+      }
+      if (paper.url) {
+        const link = node.querySelector("a");
+        link.href = paper.url;
+        link.hidden = false;
+      }
+      if (paper.status !== "read") {
+        const pick = node.querySelector("label");
+        pick.querySelector("input").value = paper.id;
+        pick.hidden = false;
+        const form = node.querySelector("form");
+        form.action = grid.dataset.base + "/" + paper.id + "/read";
+        form.hidden = false;
+      }
+      return node;
+    });
+    if (!items.length) {
+      const empty = document.createElement("p");
+      empty.textContent = "Makale yok.";
+      items.push(empty);
+    }
+    grid.replaceChildren(...items);
+  }
+
+  function load(status) {
+    const query = status ? "?status=" + encodeURIComponent(status) : "";
+    // the server answers unchanged lists with a 304, so revisiting a filter costs no body
+    return fetch(grid.dataset.api + query, { cache: "no-cache" })
+      .then((response) => response.json())
+      .then(render);
+  }
+
+  document.querySelectorAll(".filters a[data-status]").forEach((link) => {
+    link.addEventListener("click", (event) => {
+      event.preventDefault();
+      history.pushState(null, "", link.href);
+      load(link.dataset.status);
+    });
+  });
+  window.addEventListener("popstate", () => {
+    load(new URLSearchParams(location.search).get("status"));
+  });
+
+  load(new URLSearchParams(location.search).get("status"));
+})();
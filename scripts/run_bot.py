@@ -1,18 +1,22 @@
 import sys
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+if not __package__:
+    # run as a plain file (python scripts/...); the ra-* entry points import the installed package
+    from pathlib import Path
 
-from app.db import init_db
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.db import close_all, init_db
 from app.services.telegram_bot import build_application
 
 
 def main():
     init_db()
     app = build_application()
-    app.run_polling(close_loop=False)
+    try:
+        app.run_polling(close_loop=False)
+    finally:
+        close_all()
 
 
 if __name__ == "__main__":
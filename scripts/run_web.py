@@ -1,18 +1,49 @@
+import os
 import sys
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+if not __package__:
+    # run as a plain file (python scripts/...); the ra-* entry points import the installed package
+    from pathlib import Path
 
-from app.db import init_db
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from gunicorn.app.base import BaseApplication
+
+from app.config import load_config
+from app.db import close_all, init_db
 from app.web.app import create_app
 
 
+class WebApplication(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        app = create_app()
+        # with preload_app this runs in the master: close its sqlite handles so workers fork with an empty pool
+        close_all()
+        return app
+
+
 def main():
     init_db()
-    app = create_app()
-    app.run(host=app.config["WEB_HOST"], port=app.config["WEB_PORT"], debug=False)
+    config = load_config()
+    # served in-process (not exec'd) so the launcher can still find this script with pgrep
+    WebApplication(
+        {
+            "bind": f"{config.web_host}:{config.web_port}",
+            "workers": os.cpu_count() or 1,
+            # real threads: sqlite releases the GIL, so the dashboard's queries overlap (gevent would serialize them)
+            "worker_class": "gthread",
+            "threads": 4,
+            "preload_app": True,
+        }
+    ).run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+# app.config reads the environment at import time
+os.environ["SKIP_DOTENV"] = "1"
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "test-token")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ["TIMEZONE"] = "Europe/Istanbul"
+os.environ["DB_PATH"] = os.path.join(tempfile.mkdtemp(prefix="assistant-tests-"), "test.db")
@@ -0,0 +1,52 @@
+from app.services.telegram_bot import DIGEST_HEADER, DIGEST_PAGE_LIMIT, _format_digest
+
+
+def _paper(n, summary="kısa özet", url=None):
+    return {
+        "title": f"Makale {n}",
+        "relevance_score": 80.0,
+        "summary": summary,
+        "url": url or f"https://arxiv.org/abs/{n}",
+    }
+
+
+def test_short_digest_is_one_page():
+    pages = _format_digest([_paper(1), _paper(2)])
+    assert len(pages) == 1
+    assert pages[0].startswith(DIGEST_HEADER)
+    assert "https://arxiv.org/abs/2" in pages[0]
+
+
+def test_pages_stay_under_the_limit_and_keep_every_entry():
+    papers = [_paper(n, summary="x" * 700) for n in range(20)]
+    pages = _format_digest(papers)
+    assert len(pages) > 1
+    assert all(len(page) <= DIGEST_PAGE_LIMIT for page in pages)
+    text = "\n".join(pages)
+    for n in range(20):
+        assert f"• Makale {n} (80/100)" in text
+        assert f"https://arxiv.org/abs/{n}" in text
+    # entries are never split across pages
+    assert all(not page.startswith("  ") and not page.startswith("https://") for page in pages)
+
+
+def test_entry_filling_the_page_exactly():
+    head = "• Makale 1 (80/100)"
+    url = "https://arxiv.org/abs/1"
+    # header + newline + entry adds up to exactly the limit
+    size = DIGEST_PAGE_LIMIT - len(DIGEST_HEADER) - len(head) - len(url) - 3
+    pages = _format_digest([_paper(1, summary="y" * (size - 2))])
+    assert len(pages) == 1
+    assert len(pages[0]) == DIGEST_PAGE_LIMIT
+    assert not pages[0].endswith("…")
+
+
+def test_oversized_summary_keeps_header_title_and_link():
+    pages = _format_digest([_paper(1, summary="z" * 10_000), _paper(2)])
+    assert all(len(page) <= DIGEST_PAGE_LIMIT for page in pages)
+    first = pages[0].splitlines()
+    assert first[0] == DIGEST_HEADER
+    assert first[1] == "• Makale 1 (80/100)"
+    assert first[2].endswith("…")
+    assert first[3] == "https://arxiv.org/abs/1"
+    assert "https://arxiv.org/abs/2" in pages[-1]
@@ -0,0 +1,41 @@
+import pytest
+
+from app.db import execute, fetch_all, init_db
+from app.services.paper_service import store_papers_bulk
+
+
+@pytest.fixture(autouse=True)
+def papers_table():
+    init_db()
+    execute("DELETE FROM papers")
+
+
+def _row(source, source_id, title="Başlık"):
+    return (source, source_id, title, "özet", None, None, None, "2026-10-15T00:00:00+00:00")
+
+
+def test_returns_only_new_rows():
+    first = store_papers_bulk([_row("arxiv", "a1"), _row("arxiv", "a2")])
+    assert set(first) == {("arxiv", "a1"), ("arxiv", "a2")}
+
+    second = store_papers_bulk([_row("arxiv", "a2"), _row("arxiv", "a3"), _row("semantic_scholar", "a2")])
+    assert set(second) == {("arxiv", "a3"), ("semantic_scholar", "a2")}
+    assert len(fetch_all("SELECT id FROM papers")) == 4
+
+
+def test_duplicate_ids_in_one_batch():
+    inserted = store_papers_bulk([_row("arxiv", "d1", "ilk"), _row("arxiv", "d1", "ikinci")])
+    assert list(inserted) == [("arxiv", "d1")]
+    rows = fetch_all("SELECT id, title FROM papers")
+    assert [(row["id"], row["title"]) for row in rows] == [(inserted[("arxiv", "d1")], "ilk")]
+
+
+def test_null_ids_are_skipped_and_logged(caplog):
+    inserted = store_papers_bulk([_row("semantic_scholar", None, "kimliksiz"), _row("arxiv", "n1")])
+    assert list(inserted) == [("arxiv", "n1")]
+    assert len(fetch_all("SELECT id FROM papers")) == 1
+    assert "kimliksiz" in caplog.text
+
+
+def test_empty_batch():
+    assert store_papers_bulk([]) == {}
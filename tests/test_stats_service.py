@@ -0,0 +1,58 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import app.utils
+from app.db import execute, fetch_one, init_db
+from app.services.stats_service import get_read_streak
+from app.utils import get_tz, now_local, to_utc_iso
+
+
+@pytest.fixture(autouse=True)
+def paper_id():
+    init_db()
+    execute("DELETE FROM reads")
+    execute("DELETE FROM papers")
+    return execute("INSERT INTO papers(source, source_id, title, fetched_at) VALUES ('arxiv', 's1', 'T', '')")
+
+
+def _read_at(local: datetime) -> None:
+    execute(
+        "INSERT INTO reads(paper_id, read_at) VALUES ((SELECT MAX(id) FROM papers), ?)", (to_utc_iso(local),)
+    )
+
+
+def _local(day_offset: int, at: time) -> datetime:
+    day = now_local().date() - timedelta(days=day_offset)
+    return datetime.combine(day, at, tzinfo=get_tz())
+
+
+def test_days_are_counted_in_local_time():
+    # 00:30 local is still the previous day in UTC; it must count for the local day
+    _read_at(_local(0, time(0, 30)))
+    _read_at(_local(1, time(23, 50)))
+    _read_at(_local(2, time(0, 10)))
+    assert get_read_streak() == 3
+
+
+def test_gap_ends_the_streak():
+    _read_at(_local(0, time(12, 0)))
+    _read_at(_local(2, time(12, 0)))
+    assert get_read_streak() == 1
+
+
+def test_no_reads():
+    assert get_read_streak() == 0
+
+
+def test_local_date_uses_each_rows_own_dst_offset(monkeypatch):
+    monkeypatch.setattr(app.utils, "get_tz", lambda: ZoneInfo("Europe/Berlin"))
+    app.utils.from_iso_to_local.cache_clear()
+    try:
+        # 00:30 local on both sides of the spring change: +01:00 before it, +02:00 after it
+        winter = fetch_one("SELECT local_date(?) AS day", ("2026-03-28T23:30:00+00:00",))["day"]
+        summer = fetch_one("SELECT local_date(?) AS day", ("2026-03-29T22:30:00+00:00",))["day"]
+    finally:
+        app.utils.from_iso_to_local.cache_clear()
+    assert (winter, summer) == ("2026-03-29", "2026-03-30")
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import pytest
+
+from app.task_parser import parse_task_text
+from app.utils import end_of_month, get_tz
+
+
+# a Thursday afternoon
+NOW = datetime(2026, 10, 15, 16, 0, tzinfo=get_tz())
+
+
+def _at(month, day, hour, minute):
+    return datetime(2026, month, day, hour, minute, tzinfo=get_tz())
+
+
+@pytest.mark.parametrize(
+    ("text", "title", "due_at"),
+    [
+        ("PAZARTESİ toplantı", "toplantı", _at(10, 19, 0, 0)),
+        ("CUMARTESİ 10:00 sunum", "sunum", _at(10, 17, 10, 0)),
+        ("SALI günü ödev", "ödev", _at(10, 20, 0, 0)),
+        ("YARIN sunum", "sunum", _at(10, 16, 16, 0)),
+        ("BUGÜN 18:30 okuma", "okuma", _at(10, 15, 18, 30)),
+    ],
+)
+def test_uppercase_turkish(text, title, due_at):
+    assert parse_task_text(text, NOW) == (title, due_at)
+
+
+def test_weekday_only_is_midnight_like_dateparser():
+    assert parse_task_text("cuma günü sunum", NOW) == ("sunum", _at(10, 16, 0, 0))
+    # today's weekday has already started, so it means next week
+    assert parse_task_text("perşembe toplantı", NOW) == ("toplantı", _at(10, 22, 0, 0))
+
+
+def test_bare_hour_after_noon():
+    assert parse_task_text("saat 15 toplantı", NOW) == ("toplantı", _at(10, 16, 15, 0))
+    assert parse_task_text("yarın saat 20'de makale", NOW) == ("makale", _at(10, 16, 20, 0))
+
+
+def test_ambiguous_bare_hour_is_not_read_as_morning():
+    # no guess: the bot then asks when to remind
+    assert parse_task_text("yarın saat 3'te danışman toplantısı", NOW)[1] is None
+
+
+def test_this_month():
+    assert parse_task_text("bu ay makale oku", NOW) == ("makale oku", _at(10, 31, 23, 59))
+    assert parse_task_text("BU AY makale oku", NOW) == ("makale oku", _at(10, 31, 23, 59))
+
+
+def test_end_of_month_keeps_the_month():
+    assert end_of_month(NOW) == _at(10, 31, 23, 59)
+    assert end_of_month(_at(12, 5, 23, 59)) == _at(12, 31, 23, 59)
+    assert end_of_month(datetime(2028, 2, 1, 0, 0, tzinfo=get_tz())) == datetime(2028, 2, 29, 23, 59, tzinfo=get_tz())